@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Compare the psutil and /proc process backends on 1k, 5k and 20k processes.
+
+    python benchmarks/proc_backends.py --sizes 1000 5000 20000 --repeat 5
+
+Linux only. A fake /proc tree with the requested number of processes is
+written to a temporary directory and both backends are pointed at it, so
+the numbers do not depend on what happens to be running on the machine.
+"Cold" is the first refresh, which also reads the static fields of every
+process; "warm" is a later refresh where only volatile fields are read.
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil
+from modules.proc_backend import PsutilBackend, ProcfsBackend
+from modules.process_table import ProcessTable
+
+
+def make_procfs(root, count, seed=1):
+    """Write a /proc lookalike with count processes under root."""
+    rng = random.Random(seed)
+    for name in ("stat", "meminfo", "uptime"):
+        shutil.copy(os.path.join("/proc", name), os.path.join(root, name))
+    names = [f"app{i}" for i in range(max(1, count // 20))] + ["chrome", "python3", "a-very-long-process-name"]
+    for i in range(count):
+        pid = 100 + i
+        name = rng.choice(names)
+        base = os.path.join(root, str(pid))
+        os.mkdir(base)
+        utime, stime = rng.randrange(10000), rng.randrange(1000)
+        fields = ["S", "1", str(pid), str(pid), "0", "-1", "4194304", "0", "0", "0", "0",
+                  str(utime), str(stime), "0", "0", "20", "0", str(rng.randrange(1, 40)), "0",
+                  str(rng.randrange(1000, 1000000)), "104857600", str(rng.randrange(100, 50000))]
+        fields += ["0"] * 30
+        with open(os.path.join(base, "stat"), "w") as f:
+            f.write(f"{pid} ({name[:15]}) {' '.join(fields)}\n")
+        with open(os.path.join(base, "statm"), "w") as f:
+            f.write(f"25600 {fields[21]} 300 5 0 120 0\n")
+        with open(os.path.join(base, "status"), "w") as f:
+            f.write(f"Name:\t{name[:15]}\nState:\tS (sleeping)\nPid:\t{pid}\nPPid:\t1\n"
+                    f"Uid:\t0\t0\t0\t0\nGid:\t0\t0\t0\t0\nThreads:\t{fields[17]}\n"
+                    "voluntary_ctxt_switches:\t10\nnonvoluntary_ctxt_switches:\t2\n")
+        # Every 50th process looks like a kernel thread (empty command line), the next has a long one
+        with open(os.path.join(base, "cmdline"), "wb") as f:
+            if i % 50 == 1:
+                f.write(f"/usr/bin/{name}\0--config\0{'x' * 9000}\0".encode())
+            elif i % 50:
+                f.write(f"/usr/bin/{name}\0--flag\0value\0".encode())
+        os.symlink(f"/usr/bin/{name}", os.path.join(base, "exe"))
+
+
+def bench(label, make_backend, repeat):
+    table = ProcessTable(min_interval=0, backend=make_backend())
+    start = time.perf_counter()
+    table.refresh()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        table.refresh()
+    warm = (time.perf_counter() - start) / repeat
+    print(f"  {label:<8} cold {cold * 1000:9.1f} ms   warm {warm * 1000:9.1f} ms   ({len(table.entries)} processes)")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the psutil and /proc process backends.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not ProcfsBackend.is_supported():
+        print("❌ The /proc backend needs Linux.")
+        return 1
+
+    for size in args.sizes:
+        root = tempfile.mkdtemp(prefix="fake_proc_")
+        try:
+            make_procfs(root, size)
+            print(f"📊 {size} processes, {args.repeat} warm refreshes each")
+            psutil.PROCFS_PATH = root
+            slow = bench("psutil", PsutilBackend, args.repeat)
+            psutil.PROCFS_PATH = "/proc"
+            fast = bench("procfs", lambda: ProcfsBackend(root), args.repeat)
+
+            for key, entry in fast.entries.items():
+                other = slow.entries[key]
+                assert (entry['name'], entry['exe'], entry['cmdline'], entry['username']) == \
+                       (other['name'], other['exe'], other['cmdline'], other['username'])
+                assert abs(entry['memory_percent'] - other['memory_percent']) < 1e-6
+            print()
+        finally:
+            psutil.PROCFS_PATH = "/proc"
+            shutil.rmtree(root, ignore_errors=True)
+
+    print("✅ Both backends report the same processes and fields.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Record camera sessions and replay them through the vision pipeline offline.
+
+    python benchmarks/vision_replay.py record session.liamrec --seconds 30
+    python benchmarks/vision_replay.py replay session.liamrec --speed 4 --delay 0.8
+
+Replays use a CachedVisionClient instead of the real API, so request counts,
+upload bytes, drops and latency can be compared between code changes without
+a camera or network access. Vision and OCR run on the recorded timestamps, so
+replaying the same file submits the same frames and a shared --cache hits.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.camera import CameraManager
+from modules.session_recorder import CachedVisionClient
+
+
+def record(args):
+    camera_manager = CameraManager()
+    if not camera_manager.start_camera():
+        print("❌ Could not open a camera.")
+        return 1
+
+    camera_manager.start_recording(args.path, max_fps=args.max_fps)
+    print(f"🎥 Recording for {args.seconds} seconds...")
+    time.sleep(args.seconds)
+    stats = camera_manager.stop_recording()
+    camera_manager.stop_camera()
+    print(f"✅ Saved {stats['frames']} frames ({stats['bytes'] / 1024:.0f} KB) to {args.path}")
+    return 0
+
+
+def replay(args):
+    camera_manager = CameraManager()
+    client = CachedVisionClient(cache_file=args.cache, delay=args.delay)
+
+    # Vision and OCR intervals are in recorded time; narration still runs on the wall clock
+    if args.speed > 0:
+        camera_manager.narration_interval /= args.speed
+
+    spoken = []
+    # Paused until AI vision is on, so the first frames are not missed
+    camera_manager.start_replay(args.path, speed=args.speed, paused=True)
+    camera_manager.start_ai_vision(client, [{"role": "system", "content": "You are Liam."}],
+                                   speak_callback=spoken.append, auto_narrate=True,
+                                   ocr_enabled=args.ocr)
+    camera_manager.resume_replay()
+
+    start = time.time()
+    while camera_manager.camera.isOpened():
+        time.sleep(0.1)
+    # Let in-flight requests finish
+    time.sleep(args.delay + 0.5)
+    elapsed = time.time() - start
+
+    vision_stats = camera_manager.get_vision_stats()
+    camera_stats = camera_manager.get_camera_stats()
+    camera_manager.stop_camera()
+    client.save_cache()
+
+    frames = sum(stream['frames'] for stream in camera_stats.values())
+    client_stats = client.get_stats()
+    print("\n📊 Replay results")
+    print(f"Frames replayed:      {frames} in {elapsed:.1f}s ({frames / elapsed:.1f} fps)")
+    print(f"Vision requests:      {vision_stats['requests']} "
+          f"(completed {vision_stats['completed']}, stale {vision_stats['dropped_stale']}, "
+          f"superseded {vision_stats['dropped_superseded']}, errors {vision_stats['errors']})")
+    if vision_stats['avg_latency'] is not None:
+        print(f"Avg answer latency:   {vision_stats['avg_latency'] * 1000:.0f} ms")
+    print(f"Model calls:          {client_stats['calls']} (cache hits {client_stats['cache_hits']})")
+    print(f"Uploaded:             {client_stats['bytes_uploaded'] / 1024:.0f} KB")
+    print(f"Narrations:           {len(spoken)}")
+    if args.ocr:
+        print(f"Local OCR:            {camera_manager.ocr_stats}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay Liam camera sessions.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record the camera to a session file")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--seconds", type=float, default=30.0)
+    record_parser.add_argument("--max-fps", type=float, default=None)
+
+    replay_parser = subparsers.add_parser("replay", help="Replay a session through the vision pipeline")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="Replay speed; 0 plays unthrottled")
+    replay_parser.add_argument("--delay", type=float, default=0.8, help="Simulated model latency in seconds")
+    replay_parser.add_argument("--cache", default=None, help="JSON file of cached model answers")
+    replay_parser.add_argument("--ocr", action="store_true", help="Replay with OCR mode on")
+
+    args = parser.parse_args()
+    return record(args) if args.command == "record" else replay(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -39,7 +39,9 @@ class LiamConfig:
             "log_level": "INFO",
             "enable_waiting_sounds": True,
             "notepad_retry_attempts": 3,
-            "command_timeout": 30
+            "command_timeout": 30,
+            "metrics_endpoint": False,
+            "metrics_port": 9105
         },
         "security": {
             "max_input_length": 1000,
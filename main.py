@@ -22,6 +22,7 @@ import sounddevice as sd
 import soundfile as sf
 import random  
 from modules.task_manager import TaskManager
+from modules.metrics_server import MetricsServer
 
 from utils import print_banner, print_system_info, setup_logging
 from config import config
@@ -181,6 +182,11 @@ class Liam:
         
         self.camera_manager = CameraManager()
         self.task_manager = TaskManager()
+        self.metrics_server = None
+        if config.get("system", "metrics_endpoint", False):
+            # Serves the sampler's cached data on localhost for Prometheus or other local tools
+            self.metrics_server = MetricsServer(self.task_manager, port=config.get("system", "metrics_port", 9105))
+            self.metrics_server.start()
         
         self.system_message = """
         You are Liam, a helpful AI assistant that can control a laptop's peripherals and applications.
@@ -497,25 +503,27 @@ class Liam:
                     if "all" in user_input.lower():
                         limit = 30
                     
-                    description = self.task_manager.describe_processes(
-                        limit=limit, 
-                        sort_by=sort_by, 
-                        detail_level=detail_level,
-                        speak_summary=True
-                    )
-                    
-                    self.speak(description)
-                    full_description = self.task_manager.describe_processes(
-                        limit=limit, 
-                        sort_by=sort_by, 
-                        detail_level=detail_level
-                    )
-                    print(full_description)
+                    # One capture serves both the spoken summary and the printed list
+                    report = self.task_manager.capture_report(limit=limit, sort_by=sort_by)
+                    self.speak(report.render('spoken'))
+                    print(report.render(detail_level))
             except Exception as e:
                 print(f"Error handling Task Manager command: {e}")
                 self.speak("I encountered an error while trying to read the system processes.")
             return
 
+        # "How much is VS Code using" - totals across all of an application's processes
+        app_usage_keywords = ["how much is", "how much cpu", "how much memory", "how much ram", "how much resources"]
+        if (any(keyword in user_input.lower() for keyword in app_usage_keywords) and
+                any(word in user_input.lower() for word in ["using", "taking", "use"])):
+            try:
+                intelligent_response = self.task_manager.analyze_user_query(user_input)
+                if intelligent_response:
+                    self.speak(intelligent_response)
+                    return
+            except Exception as e:
+                print(f"Error handling application usage command: {e}")
+
         process_search_keywords = ["find process", "search process", "look for process", "is running", "find application"]
         if any(keyword in user_input.lower() for keyword in process_search_keywords):
             try:
@@ -573,15 +581,24 @@ class Liam:
                     self.speak(intelligent_response)
                     return
                     
-                self.speak("Checking your system's resource usage...")
-                
-                resource_info = self.task_manager.get_system_resource_usage()
-                
-                response = (f"Your system is currently using {resource_info['cpu_percent']}% of CPU capacity. "
-                           f"Memory usage is at {resource_info['memory']['percent']}%, with "
-                           f"{resource_info['memory']['available'] / (1024 * 1024 * 1024):.1f} GB available. "
-                           f"Your system disk is {resource_info['disk']['percent']}% full.")
-                
+                # Served from the background sampler, so this answers immediately
+                resource_info = self.task_manager.get_system_resource_usage(window=10)
+
+                response = (f"Over the last 10 seconds your system used {resource_info['cpu_percent']}% of CPU capacity")
+                if resource_info['per_core_cpu'] and len(resource_info['per_core_cpu']) > 1:
+                    response += f", with the busiest core at {max(resource_info['per_core_cpu'])}%"
+                response += (f". Memory usage is at {resource_info['memory']['percent']}%, with "
+                            f"{resource_info['memory']['available'] / (1024 * 1024 * 1024):.1f} GB available")
+                if resource_info['swap']['total']:
+                    response += f", and swap is {resource_info['swap']['percent']}% used"
+                response += f". Your system disk is {resource_info['disk']['percent']}% full."
+                disk_io, network = resource_info['disk_io'], resource_info['network']
+                if disk_io['read_bytes_per_sec'] is not None:
+                    response += (f" The disk is reading {disk_io['read_bytes_per_sec'] / (1024 * 1024):.1f} MB/s "
+                                f"and writing {disk_io['write_bytes_per_sec'] / (1024 * 1024):.1f} MB/s, and the network is "
+                                f"receiving {network['recv_bytes_per_sec'] / 1024:.0f} KB/s and sending "
+                                f"{network['sent_bytes_per_sec'] / 1024:.0f} KB/s.")
+
                 self.speak(response)
             except Exception as e:
                 print(f"Error handling resource usage command: {e}")
@@ -590,9 +607,18 @@ class Liam:
             
         camera_on_keywords = ["open camera", "turn on camera", "start camera", "show camera"]
         camera_off_keywords = ["close camera", "turn off camera", "stop camera", "hide camera"]
+        multi_camera_keywords = ["open all cameras", "turn on all cameras", "start all cameras", "use all cameras"]
         vision_keywords = ["see what's happening", "see what happened", "describe what you see", 
                             "access the camera", "what do you see", "look through the camera",
-                            "camera vision", "see what's going on", "what is happening"]
+                            "camera vision"]
+        vision_detail_keywords = ["describe", "detail", "more about", "tell me more"]
+        motion_keywords = ["see what's happening", "see what's going on", "watch what's happening",
+                           "what's happening on the camera", "what is happening on the camera",
+                           "what's happening in front of the camera", "what just happened on the camera",
+                           "what am i doing", "what are they doing"]
+        # Too general to turn the camera on for, but meant for it when it is already watching
+        active_motion_keywords = ["what is happening", "what's happening", "what's going on",
+                                  "what is going on", "what just happened"]
         read_text_keywords = ["read text", "read what it says", "what does it say", 
                                 "can you read", "read the text", "read the camera",
                                 "make the ai read", "read what you see", "read about it",
@@ -609,6 +635,21 @@ class Liam:
 
         exit_keywords = ["quit", "exit", "goodbye"]
 
+        if any(keyword in user_input.lower() for keyword in multi_camera_keywords):
+            try:
+                self.speak("Sure! Opening all available cameras.")
+                started = self.camera_manager.start_camera(multi_camera=True)
+                if started:
+                    count = self.camera_manager.camera_count
+                    self.speak(f"{count} camera{'s are' if count != 1 else ' is'} now on.")
+                    print(self.camera_manager.get_camera_stats())
+                else:
+                    self.speak("I couldn't open the camera.")
+            except Exception as e:
+                print(f"Error handling camera command: {e}")
+                self.speak("I encountered an error while trying to open the cameras.")
+            return
+
         if any(keyword in user_input.lower() for keyword in camera_on_keywords):
             try:
                 self.speak("Sure! Opening the camera now.")
@@ -622,6 +663,31 @@ class Liam:
                 self.speak("I encountered an error while trying to open the camera.")
             return
 
+        if any(keyword in user_input.lower() for keyword in motion_keywords) or (
+                self.camera_manager.is_active and
+                any(keyword in user_input.lower() for keyword in active_motion_keywords)):
+            try:
+                wait = 0.0
+                if not self.camera_manager.is_active:
+                    self.speak("I need to turn on the camera first.")
+                    started = self.camera_manager.start_camera()
+                    if not started:
+                        self.speak("I couldn't open the camera.")
+                        return
+                    self.speak("Camera is now on. Let me watch for a moment.")
+                    # The keyframe history starts empty; let it cover the motion window first
+                    wait = self.camera_manager.motion_window + 1.0
+                
+                description = self.camera_manager.describe_motion(self.client, self.conversation_history, wait=wait)
+                if description:
+                    self.speak(f"Here's what's happening: {description}")
+                else:
+                    self.speak("I haven't seen enough yet. Please ask me again in a moment.")
+            except Exception as e:
+                print(f"Error handling motion vision command: {e}")
+                self.speak("I encountered an error while trying to see what's happening.")
+            return
+
         if any(keyword in user_input.lower() for keyword in vision_keywords):
             try:
                 if self.camera_manager.is_active:
@@ -634,12 +700,18 @@ class Liam:
                         return
                     self.speak("Camera is now on.")
                 
+                # Answer from the local detector first; the cloud model is only asked for detail
+                if not any(keyword in user_input.lower() for keyword in vision_detail_keywords):
+                    summary = self.camera_manager.get_object_summary()
+                    if summary:
+                        self.speak(f"At a glance I can see {summary}. Ask me to describe it if you want more detail.")
+                        return
+                
                 if not self.camera_manager.is_ai_vision_enabled:
                     self.speak("Enabling my vision capabilities.")
                     self.camera_manager.start_ai_vision(self.client, self.conversation_history)
-                    time.sleep(2)
                 
-                description = self.camera_manager.get_latest_ai_description()
+                description = self.camera_manager.describe_now()
                 if description:
                     self.speak(f"Through the camera, I can see: {description}")
                 else:
@@ -680,17 +752,16 @@ class Liam:
                         ocr_enabled=True
                     )
                     self.speak("I'll now try to read any text I see through the camera.")
-                    time.sleep(2)
                 else:
                     self.camera_manager.enable_ocr(True)
                     self.camera_manager.set_auto_narrate(True, self.speak)
                     self.speak("I'll now try to read any text I see through the camera.")
                 
-                ocr_text = self.camera_manager.get_latest_ocr_text()
+                ocr_text = self.camera_manager.read_text_now() or self.camera_manager.get_latest_ocr_text()
                 if ocr_text:
                     self.speak(f"I can read the following text: {ocr_text}")
                 else:
-                    description = self.camera_manager.get_latest_ai_description()
+                    description = self.camera_manager.describe_now()
                     if description and "text" in description.lower():
                         self.speak(f"The AI sees some text: {description}")
                     else:
@@ -774,9 +845,8 @@ class Liam:
                 if not self.camera_manager.is_ai_vision_enabled:
                     self.speak("Activating AI Vision to analyze the camera feed.")
                     self.camera_manager.start_ai_vision(self.client, self.conversation_history)
-                    time.sleep(2)
                 
-                description = self.camera_manager.get_latest_ai_description()
+                description = self.camera_manager.describe_now()
                 if description:
                     self.speak(f"Here's what I see: {description}")
                 else:
@@ -913,6 +983,9 @@ class Liam:
         finally:
             if self.camera_manager.is_active:
                 self.camera_manager.stop_camera()
+            if self.metrics_server is not None:
+                self.metrics_server.stop()
+            self.task_manager.stop()
 
 
 def main():
@@ -1,6 +1,20 @@
-from .camera import CameraManager
-from .write.notepad import handle_notepad_ai
-from .waiting_sounds import WaitingSounds
-from .task_manager import TaskManager
+import importlib
 
-__all__ = ['CameraManager', 'handle_notepad_ai', 'WaitingSounds', 'TaskManager']
+_EXPORTS = {
+    'CameraManager': '.camera',
+    'handle_notepad_ai': '.write.notepad',
+    'WaitingSounds': '.waiting_sounds',
+    'TaskManager': '.task_manager',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Imported on first use, so submodules such as modules.proc_backend can be
+    # loaded without the Windows-only notepad dependencies
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
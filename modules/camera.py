@@ -1,17 +1,35 @@
 import cv2
 import time
-import base64
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
 from typing import Optional, Dict, List, Any
 import numpy as np
 from PIL import Image
 import io
 import sys
+from .face_tracker import FaceTracker
+from .ocr import LocalOCR
+from .frame_encoder import FrameEncoder
+from .camera_discovery import CameraDiscovery
+from .camera_stream import CameraStream, tile_frames
+from .session_recorder import SessionRecorder, ReplayCapture
+from .keyframes import KeyframeBuffer
+from .roi import MotionRegionDetector
+from .narration_filter import NarrationFilter
+from .object_detector import ObjectDetector
+from .vision_events import VisionEventBus
+from .frame_share import SharedFrameWriter
 
 class CameraManager:
     def __init__(self):
         self.camera: Optional[cv2.VideoCapture] = None
+        self.camera_index: Optional[int] = None
+        self.camera_settings: Dict[str, Any] = {'width': 640, 'height': 480, 'fps': 30,
+                                                'fourcc': 'MJPG', 'buffer_size': 1}
+        self.low_latency_capture: bool = True
+        self.discovery = CameraDiscovery()
+        self.streams: Dict[int, CameraStream] = {}
         self.camera_active: bool = False
         self.camera_thread: Optional[threading.Thread] = None
         self.analysis_active: bool = False
@@ -19,11 +37,31 @@ class CameraManager:
         self.current_frame: Optional[np.ndarray] = None
         self.frame_lock = threading.Lock()
         self.last_analysis: Optional[Dict[str, Any]] = None
+        self.analysis_lock = threading.Lock()
+        self.events = VisionEventBus()
+        self.scene_change_threshold: float = 20.0
+        self._last_face_count: int = 0
         self.analysis_interval: float = 1.0
         self.analysis_error_count: int = 0
         self.max_analysis_errors: int = 5
         self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        self.face_tracking_enabled: bool = True
+        self.face_detect_every: int = 10
+        self.face_tracker = FaceTracker(self.face_cascade, detect_every=self.face_detect_every)
         self.display_with_analysis: bool = False
+        self.display_enabled: bool = True
+        self.recorder: Optional[SessionRecorder] = None
+        self.frame_exporter: Optional[SharedFrameWriter] = None
+        self.motion_keyframes: int = 4
+        self.motion_window: float = 4.0
+        self.motion_layout: str = "grid"
+        self.keyframes = KeyframeBuffer()
+        self.roi_enabled: bool = True
+        self.roi_context_share: float = 0.2
+        self.roi_context_max_dim: int = 320
+        self.roi_detector = MotionRegionDetector()
+        self.ai_client = None
+        self.conversation_history = None
         self.ai_vision_enabled: bool = False
         self.ai_vision_thread: Optional[threading.Thread] = None
         self.ai_vision_interval: float = 3.0
@@ -33,13 +71,61 @@ class CameraManager:
         self.last_spoken_description = ""
         self.narration_interval: float = 6.0
         self.last_narration_time: float = 0
+        self.narration_filter = NarrationFilter()
         self.ocr_enabled: bool = False
         self.last_ocr_text: str = ""
+        self.local_ocr = LocalOCR()
+        self.ocr_thread: Optional[threading.Thread] = None
+        self.ocr_interval: float = 1.0
+        self.ocr_confidence_threshold: float = 60.0
+        self.last_ocr_result: Optional[Dict[str, Any]] = None
+        self.last_ocr_time: float = 0
+        self.ocr_stats: Dict[str, Any] = {'passes': 0, 'confident': 0, 'unconfident': 0, 'escalated': 0,
+                                          'last_duration': None}
+        self.current_frame_time: float = 0
+        self.max_inflight_requests: int = 2
+        self.max_result_age: float = 5.0
+        self._vision_executor: Optional[ThreadPoolExecutor] = None
+        self._inflight_requests = threading.BoundedSemaphore(self.max_inflight_requests)
+        self._vision_session: int = 0
+        self._vision_result_lock = threading.Lock()
+        self._inflight_futures: Dict[Future, float] = {}
+        self._last_applied_capture_time: float = 0
+        self.vision_stats: Dict[str, Any] = self._new_vision_stats()
+        self.frame_encoder = FrameEncoder()
+        self.last_encode_info: Optional[Dict[str, Any]] = None
+        self.object_detector = ObjectDetector()
+        self.object_detection_enabled: bool = True
+        self.object_detection_interval: float = 1.0
+        self.object_detection_thread: Optional[threading.Thread] = None
+        self.last_detections: List[Dict[str, Any]] = []
+        self.last_detection_time: float = 0
+        self.detection_stats: Dict[str, Any] = {'passes': 0, 'last_duration': None}
+
+    @staticmethod
+    def _new_vision_stats() -> Dict[str, Any]:
+        return {
+            'requests': 0,
+            'completed': 0,
+            'dropped_stale': 0,
+            'dropped_superseded': 0,
+            'errors': 0,
+            'on_demand': 0,
+            'reused': 0,
+            'deadline_fallbacks': 0,
+            'last_frame_age': None,
+            'last_latency': None,
+            'avg_latency': None
+        }
 
     @property
     def is_active(self) -> bool:
         return self.camera_active and self.camera is not None and self.camera.isOpened()
 
+    @property
+    def is_replaying(self) -> bool:
+        return isinstance(self.camera, ReplayCapture)
+
     @property
     def is_analyzing(self) -> bool:
         return self.analysis_active
@@ -48,10 +134,21 @@ class CameraManager:
     def is_ai_vision_enabled(self) -> bool:
         return self.ai_vision_enabled
 
-    def start_camera(self, with_analysis: bool = False):
-        """Start camera with improved error handling and validation."""
+    @property
+    def is_local_ocr_available(self) -> bool:
+        return self.local_ocr.is_available
+
+    def start_camera(self, with_analysis: bool = False, multi_camera: bool = False):
+        """
+        Start camera with improved error handling and validation.
+        
+        With multi_camera=True every other working device is opened as well,
+        each with its own capture thread and frame buffer.
+        """
         if self.camera_active:
             print("DEBUG: Camera already active.")
+            if multi_camera:
+                self._start_secondary_cameras()
             return True
 
         print("DEBUG: Attempting to open camera...")
@@ -63,107 +160,355 @@ class CameraManager:
             except Exception as e:
                 print(f"DEBUG: Error releasing previous camera: {e}")
             
-        camera_opened = False
-        last_error = None
-        
-        # Try multiple camera indices with better error handling
-        for camera_index in range(5):  # Increased range for more camera options
-            try:
-                print(f"DEBUG: Trying camera index {camera_index}...")
-                self.camera = cv2.VideoCapture(camera_index)
-                
-                if self.camera.isOpened():
-                    # Test if we can actually read from the camera
-                    ret, frame = self.camera.read()
-                    if ret and frame is not None:
-                        camera_opened = True
-                        print(f"DEBUG: Successfully opened and tested camera at index {camera_index}")
-                        break
-                    else:
-                        print(f"DEBUG: Camera {camera_index} opened but cannot read frames")
-                        self.camera.release()
-                else:
-                    print(f"DEBUG: Camera {camera_index} failed to open")
-                    self.camera.release()
-                    
-            except Exception as e:
-                last_error = e
-                print(f"DEBUG: Exception with camera {camera_index}: {str(e)}")
-                if self.camera:
-                    try:
-                        self.camera.release()
-                    except:
-                        pass
-                
+        # Cached device first, then a parallel probe of the remaining candidates
+        self.camera, self.camera_index = self.discovery.open_camera(self.camera_settings)
+        camera_opened = self.camera is not None
         self.camera_active = camera_opened
         
         if not camera_opened:
-            error_msg = f"Could not open any camera. Last error: {last_error}" if last_error else "No cameras found or accessible."
-            print(f"ERROR: {error_msg}")
+            print("ERROR: No cameras found or accessible.")
             return False
         
-        # Set camera properties for better performance
+        # Properties were applied while opening; remember what the driver negotiated
         try:
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.camera.set(cv2.CAP_PROP_FPS, 30)
+            self.discovery.save_cache(self.camera_index, self.discovery.read_settings(self.camera))
         except Exception as e:
-            print(f"DEBUG: Could not set camera properties: {e}")
+            print(f"DEBUG: Could not read camera properties: {e}")
         
+        self._start_primary_stream(with_analysis)
+        
+        if multi_camera:
+            self._start_secondary_cameras()
+        
+        return True
+    
+    def _start_primary_stream(self, with_analysis, display=None):
+        self.camera_active = True
         self.display_with_analysis = with_analysis
-        self.camera_thread = threading.Thread(target=self._camera_loop, name="CameraThread")
-        self.camera_thread.daemon = True
-        self.camera_thread.start()
+        primary = CameraStream(self.camera_index, self.camera, primary=True)
+        primary.display = self.display_enabled if display is None else display
+        # A replay has no driver queue, so skipping quick grabs would only drop recorded frames
+        primary.low_latency = self.low_latency_capture and not self.is_replaying
+        self.streams = {self.camera_index: primary}
+        self._start_stream(primary)
+        self.camera_thread = primary.thread
         print("DEBUG: Camera thread started successfully.")
         
+        if self.object_detection_enabled:
+            self._start_detector_stage()
+    
+    def start_replay(self, path, speed: float = 1.0, loop: bool = False,
+                     with_analysis: bool = False, display: bool = False, paused: bool = False):
+        """
+        Feed a recorded session into the camera pipeline instead of a live device.
+        
+        speed scales the recorded pace (0 plays as fast as frames are consumed).
+        Everything downstream - face tracking, OCR and AI vision - runs as it
+        does on live frames, except that OCR and vision requests are scheduled
+        on the recorded timestamps, in step with the capture thread, so
+        replaying a file again submits the same frames. With paused=True no
+        frame plays until resume_replay(), e.g. once AI vision is started.
+        """
+        if self.camera_active:
+            print("DEBUG: Camera already active; stop it before replaying.")
+            return False
+        
+        self.camera = ReplayCapture(path, speed=speed, loop=loop, paused=paused)
+        self.camera_index = -1
+        # The schedules now run on recorded time
+        self.last_ai_frame_time = 0
+        self.last_ocr_time = 0
+        self._start_primary_stream(with_analysis, display=display)
+        print(f"DEBUG: Replaying session {path} at {speed}x")
         return True
+    
+    def resume_replay(self):
+        """Start playing a replay opened with paused=True"""
+        if not self.is_replaying:
+            return False
+        self.camera.resume()
+        return True
+    
+    def _clock(self) -> float:
+        """Time the OCR and vision schedules run on: recorded time during a replay, else wall time."""
+        camera = self.camera
+        if isinstance(camera, ReplayCapture):
+            return camera.clock()
+        return time.time()
+    
+    def start_recording(self, path, max_fps: Optional[float] = None, quality: int = 80):
+        """Record the primary camera's frames to a session file for later replay"""
+        if self.recorder is not None:
+            print("DEBUG: Already recording.")
+            return False
+        
+        recorder = SessionRecorder(path, quality=quality, max_fps=max_fps)
+        recorder.start({'camera_index': self.camera_index, 'settings': self.camera_settings})
+        self.recorder = recorder
+        return True
+    
+    def stop_recording(self):
+        """Stop recording and return the frame/byte counters, or None if not recording"""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None:
+            return None
+        return recorder.stop()
+    
+    def start_frame_export(self, name: str = "liam_camera", slots: int = 4):
+        """
+        Publish primary camera frames into a shared-memory ring named name.
+        
+        Other processes can read them without copying through
+        modules.frame_share.SharedFrameReader(name).
+        """
+        if self.frame_exporter is not None:
+            print("DEBUG: Frame export already running.")
+            return False
+        
+        width = max(self.camera_settings.get('width') or 0, 1920)
+        height = max(self.camera_settings.get('height') or 0, 1080)
+        try:
+            self.frame_exporter = SharedFrameWriter(name, slots=slots, max_width=width, max_height=height)
+        except Exception as e:
+            print(f"ERROR: Could not create shared frame buffer: {e}")
+            return False
+        return True
+    
+    def stop_frame_export(self):
+        """Stop sharing frames and remove the shared-memory segment"""
+        exporter, self.frame_exporter = self.frame_exporter, None
+        if exporter is None:
+            return None
+        stats = exporter.get_stats()
+        exporter.close()
+        return stats
+    
+    def _start_stream(self, stream):
+        stream.thread = threading.Thread(
+            target=self._camera_loop,
+            args=(stream,),
+            name="CameraThread" if stream.primary else f"CameraThread-{stream.index}"
+        )
+        stream.thread.daemon = True
+        stream.thread.start()
+    
+    def _start_secondary_cameras(self):
+        """Open every other working camera in parallel and start a capture thread for each."""
+        candidates = [i for i in self.discovery.candidate_indices() if i not in self.streams]
+        opened = self.discovery.probe(candidates, self.camera_settings)
+        
+        for index, capture in sorted(opened.items()):
+            stream = CameraStream(index, capture)
+            stream.display = self.display_enabled
+            stream.low_latency = self.low_latency_capture
+            self.streams[index] = stream
+            self._start_stream(stream)
+            print(f"DEBUG: Additional camera {index} started.")
+        
+        return len(opened)
+    
+    @property
+    def camera_count(self) -> int:
+        return sum(1 for stream in self.streams.values() if stream.is_open)
 
-    def _camera_loop(self):
-        print("DEBUG: Entered camera loop.")
-        while self.camera_active and self.camera.isOpened():
-            ret, frame = self.camera.read()
+    def _camera_loop(self, stream):
+        print(f"DEBUG: Entered camera loop for camera {stream.index}.")
+        while self.camera_active and stream.is_open:
+            read_start = time.time()
+            ret, frame, frame_time = stream.read()
             if ret:
-                with self.frame_lock:
-                    self.current_frame = frame.copy()
+                stream.record_frame(frame, frame_time, time.time() - read_start)
                 
-                display_frame = frame.copy()
-                if self.display_with_analysis:
-                    display_frame = self._draw_analysis_on_frame(display_frame)
+                if stream.primary:
+                    with self.frame_lock:
+                        self.current_frame = frame.copy()
+                        self.current_frame_time = frame_time
+                    
+                    if self.face_tracking_enabled:
+                        self._update_faces(frame)
+                    
+                    recorder = self.recorder
+                    if recorder is not None:
+                        recorder.write(frame, frame_time)
+                    
+                    exporter = self.frame_exporter
+                    if exporter is not None:
+                        exporter.write(frame, frame_time)
+                    
+                    change_score = self.keyframes.offer(frame, frame_time)
+                    if change_score is not None and change_score >= self.scene_change_threshold:
+                        self.events.publish('scene_change', {'score': change_score}, frame_time)
+                    
+                    if self.roi_enabled:
+                        self.roi_detector.update(frame, frame_time)
+                    
+                    if self.is_replaying:
+                        self._replay_step()
                 
-                try:
-                    cv2.imshow('Liam Camera', display_frame)
-                    cv2.waitKey(1)
-                except Exception as e:
-                    print(f"ERROR: Failed to display frame: {str(e)}")
+                if stream.display:
+                    display_frame = frame.copy()
+                    if self.display_with_analysis and stream.primary:
+                        display_frame = self._draw_analysis_on_frame(display_frame)
+                    
+                    try:
+                        cv2.imshow(stream.window_name, display_frame)
+                        cv2.waitKey(1)
+                    except Exception as e:
+                        print(f"ERROR: Failed to display frame: {str(e)}")
+            elif not stream.is_open:
+                # Replayed sessions close themselves at the end of the recording
+                print(f"DEBUG: Camera {stream.index} stream ended.")
+                break
             else:
-                print("ERROR: Failed to read frame from camera.")
+                stream.failures += 1
+                print(f"ERROR: Failed to read frame from camera {stream.index}.")
                 break
         
-        if self.camera:
-            self.camera.release()
-            print("DEBUG: Camera released.")
-        cv2.destroyAllWindows()
-        print("DEBUG: All OpenCV windows destroyed.")
+        stream.release()
+        print(f"DEBUG: Camera {stream.index} released.")
+        if stream.primary and stream.display:
+            cv2.destroyAllWindows()
+            print("DEBUG: All OpenCV windows destroyed.")
+
+    def get_camera_stats(self):
+        """Return per-camera fps, read latency and frame age"""
+        return {index: stream.get_stats() for index, stream in self.streams.items()}
+    
+    def _snapshot_frames(self):
+        """
+        Return (frame, capture_time, camera_labels) for a vision request.
+        
+        With several cameras the newest frames are tiled into one image so a
+        single request covers all of them; capture_time is the oldest tile's.
+        """
+        open_streams = [stream for stream in self.streams.values() if stream.is_open]
+        if len(open_streams) <= 1:
+            with self.frame_lock:
+                if self.current_frame is None:
+                    return None, 0, []
+                return self.current_frame.copy(), self.current_frame_time, []
+        
+        frames, times, labels = [], [], []
+        for stream in sorted(open_streams, key=lambda s: (not s.primary, s.index)):
+            frame, frame_time = stream.latest()
+            if frame is not None:
+                frames.append(frame)
+                times.append(frame_time)
+                labels.append(f"Camera {len(labels) + 1}")
+        
+        if not frames:
+            return None, 0, []
+        if len(frames) == 1:
+            return frames[0], times[0], []
+        return tile_frames(frames, labels), min(times), labels
+
+    def _update_faces(self, frame):
+        """Run the face detection/tracking stage on one camera frame."""
+        try:
+            self.face_tracker.update(frame)
+        except Exception as e:
+            print(f"ERROR: Face tracking failed: {str(e)}")
+            return
+        
+        faces = self.face_tracker.get_faces()
+        if len(faces) != self._last_face_count:
+            self._last_face_count = len(faces)
+            self.events.publish('faces', faces, self.current_frame_time)
 
     def _draw_analysis_on_frame(self, frame):
-        if self.last_analysis and 'faces' in self.last_analysis:
-            for (x, y, w, h) in self.last_analysis['faces']:
-                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+        for (x, y, w, h) in self.face_tracker.get_faces():
+            cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+        
+        for detection in self.last_detections:
+            x, y, w, h = detection['box']
+            cv2.rectangle(frame, (x, y), (x+w, y+h), (255, 128, 0), 1)
+            cv2.putText(frame, detection['label'], (x, max(12, y - 4)),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 128, 0), 1)
         
         return frame
     
+    def _start_detector_stage(self):
+        if not self.camera_active or not self.object_detector.is_available:
+            return False
+        if self.object_detection_thread and self.object_detection_thread.is_alive():
+            return True
+        self.object_detection_thread = threading.Thread(target=self._detector_loop, name="ObjectDetectorThread")
+        self.object_detection_thread.daemon = True
+        self.object_detection_thread.start()
+        print("DEBUG: Local object detector thread started.")
+        return True
+    
+    def _detector_loop(self):
+        """Run the local object detector at object_detection_interval while the camera is on."""
+        print("DEBUG: Entered object detector loop.")
+        
+        while self.object_detection_enabled and self.camera_active:
+            with self.frame_lock:
+                frame = self.current_frame.copy() if self.current_frame is not None else None
+            
+            if frame is not None:
+                try:
+                    self._run_object_detection(frame)
+                except Exception as e:
+                    print(f"ERROR in object detector loop: {str(e)}")
+            
+            time.sleep(self.object_detection_interval)
+        
+        print("DEBUG: Exited object detector loop.")
+    
+    def _run_object_detection(self, frame):
+        start = time.perf_counter()
+        detections = self.object_detector.detect(frame)
+        self.last_detections = detections
+        self.last_detection_time = time.time()
+        self.detection_stats['passes'] += 1
+        self.detection_stats['last_duration'] = time.perf_counter() - start
+        return detections
+    
+    def get_object_summary(self, max_age: float = 3.0):
+        """
+        Return a spoken summary of locally detected objects, e.g. "a person and a chair".
+        
+        Detections older than max_age are refreshed from the current frame first.
+        Returns None when the detector is unavailable, and "" when nothing was found.
+        """
+        if not self.object_detector.is_available:
+            return None
+        
+        if time.time() - self.last_detection_time > max_age:
+            with self.frame_lock:
+                frame = self.current_frame.copy() if self.current_frame is not None else None
+            if frame is None:
+                return None
+            self._run_object_detection(frame)
+        
+        return self.object_detector.summarize(self.last_detections)
+    
     def stop_camera(self):
         print("DEBUG: Stopping camera...")
         self.camera_active = False
         
         self.stop_ai_vision()
+        self.stop_recording()
+        
+        for stream in list(self.streams.values()):
+            if stream.thread and stream.thread.is_alive():
+                stream.thread.join(timeout=1.0)
+        self.streams = {}
+        self.stop_frame_export()
         
-        if self.camera_thread and self.camera_thread.is_alive():
-            self.camera_thread.join(timeout=1.0)
+        self.face_tracker.reset()
+        self._last_face_count = 0
+        self.keyframes.clear()
+        self.roi_detector.reset()
+        self.last_detections = []
+        self.last_detection_time = 0
             
         return True
     
     def set_auto_narrate(self, enabled: bool, speak_callback=None):
+        if enabled and not self.auto_narrate:
+            self.narration_filter.reset()
         self.auto_narrate = enabled
         if speak_callback is not None:
             self.speak_callback = speak_callback
@@ -188,10 +533,27 @@ class CameraManager:
         
         self.set_auto_narrate(auto_narrate, speak_callback)
         
-        self.ai_vision_thread = threading.Thread(target=self._ai_vision_loop)
-        self.ai_vision_thread.daemon = True
-        self.ai_vision_thread.start()
-        print("DEBUG: AI vision thread started.")
+        # Requests still in flight from an earlier session keep their own semaphore and are ignored
+        self._vision_session += 1
+        self._inflight_requests = threading.BoundedSemaphore(self.max_inflight_requests)
+        # One worker more than the cap, so a user question never queues behind periodic requests
+        self._vision_executor = ThreadPoolExecutor(
+            max_workers=self.max_inflight_requests + 1,
+            thread_name_prefix="VisionRequest"
+        )
+        self._last_applied_capture_time = 0
+        self._inflight_futures = {}
+        self.vision_stats = self._new_vision_stats()
+        
+        # A replay schedules requests from its capture thread instead
+        if not self.is_replaying:
+            self.ai_vision_thread = threading.Thread(target=self._ai_vision_loop)
+            self.ai_vision_thread.daemon = True
+            self.ai_vision_thread.start()
+            print("DEBUG: AI vision thread started.")
+        
+        if ocr_enabled:
+            self._start_ocr_stage()
         
         # Announce AI vision is active if speech callback is provided
         if speak_callback and not auto_narrate:
@@ -202,158 +564,567 @@ class CameraManager:
     def enable_ocr(self, enabled: bool):
         """Enable or disable OCR functionality in AI vision"""
         self.ocr_enabled = enabled
+        if enabled:
+            self._start_ocr_stage()
         print(f"DEBUG: OCR {'enabled' if enabled else 'disabled'}")
         return True
     
+    def _start_ocr_stage(self):
+        if not self.camera_active or not self.local_ocr.is_available:
+            return False
+        if self.ocr_thread and self.ocr_thread.is_alive():
+            return True
+        if self.is_replaying:
+            # The capture thread reads text in step with the recorded frames
+            return True
+        self.ocr_thread = threading.Thread(target=self._ocr_loop, name="OCRThread")
+        self.ocr_thread.daemon = True
+        self.ocr_thread.start()
+        print("DEBUG: Local OCR thread started.")
+        return True
+    
+    def _ocr_loop(self):
+        """Read text locally at ocr_interval while OCR mode is on."""
+        print("DEBUG: Entered local OCR loop.")
+        
+        while self.ocr_enabled and self.camera_active:
+            with self.frame_lock:
+                frame = self.current_frame.copy() if self.current_frame is not None else None
+            
+            if frame is not None:
+                try:
+                    self._apply_ocr_result(self.local_ocr.read(frame))
+                except Exception as e:
+                    print(f"ERROR in local OCR loop: {str(e)}")
+            
+            time.sleep(self.ocr_interval)
+            
+        print("DEBUG: Exited local OCR loop.")
+    
+    def _apply_ocr_result(self, result, narrate=True):
+        self.last_ocr_result = result
+        self.last_ocr_time = self._clock()
+        self.ocr_stats['passes'] += 1
+        self.ocr_stats['last_duration'] = result['duration']
+        
+        if result['text'] and result['confidence'] >= self.ocr_confidence_threshold:
+            self.ocr_stats['confident'] += 1
+            self.last_ocr_text = result['text']
+            self.events.publish('ocr_text', {'text': result['text'], 'source': 'local',
+                                             'confidence': result['confidence']}, self.current_frame_time)
+            if narrate:
+                self._narrate(result['text'], message=f"I can read: {result['text']}")
+            else:
+                # The caller speaks it; keep the OCR loop from repeating it straight away
+                self.last_spoken_description = result['text']
+                self.last_narration_time = time.time()
+        else:
+            self.ocr_stats['unconfident'] += 1
+    
+    def _local_ocr_is_confident(self):
+        """True when a recent local OCR pass read text well enough to skip the cloud model."""
+        result = self.last_ocr_result
+        if not result or self._clock() - self.last_ocr_time > self.ocr_interval * 2 + 1.0:
+            return False
+        return bool(result['text']) and result['confidence'] >= self.ocr_confidence_threshold
+    
+    def read_text_now(self, narrate=False):
+        """
+        Run local OCR on the current frame and return the text, or None if nothing was read confidently.
+        
+        The result is recorded like any OCR pass but only narrated when narrate is True,
+        since callers usually speak the returned text themselves.
+        """
+        if not self.local_ocr.is_available:
+            return None
+        
+        with self.frame_lock:
+            frame = self.current_frame.copy() if self.current_frame is not None else None
+        if frame is None:
+            return None
+        
+        result = self.local_ocr.read(frame)
+        self._apply_ocr_result(result, narrate=narrate)
+        if result['text'] and result['confidence'] >= self.ocr_confidence_threshold:
+            return result['text']
+        return None
+    
     def stop_ai_vision(self):
         print("DEBUG: Stopping AI vision...")
         self.ai_vision_enabled = False
         
         if self.ai_vision_thread and self.ai_vision_thread.is_alive():
             self.ai_vision_thread.join(timeout=1.0)
+        
+        # In-flight requests finish in the background; their results are ignored
+        if self._vision_executor:
+            self._vision_executor.shutdown(wait=False)
+            self._vision_executor = None
             
         return True
     
     def _ai_vision_loop(self):
+        """
+        Schedule vision requests without blocking on them.
+
+        Each tick snapshots the newest frame together with its capture time and
+        hands it to the request pool. Encoding and the API call run on pool
+        workers, and at most ``max_inflight_requests`` are outstanding at once,
+        so one slow response no longer stalls the following frames.
+        """
         print("DEBUG: Entered AI vision loop.")
+        executor = self._vision_executor
+        slots = self._inflight_requests
+        session = self._vision_session
         
-        while self.ai_vision_enabled and self.camera_active:
-            current_time = time.time()
-            
-            if current_time - self.last_ai_frame_time >= self.ai_vision_interval:
-                self.last_ai_frame_time = current_time
-                
-                try:
-                    with self.frame_lock:
-                        if self.current_frame is not None:
-                            frame = self.current_frame.copy()
-                        else:
-                            time.sleep(0.1)
-                            continue
-                    
-                    encoded_image = self._encode_frame_for_ai(frame)
-                    
-                    # Adjust the prompt based on OCR setting
-                    if self.ocr_enabled:
-                        prompt_text = "What text do you see in this image from my camera? Read any visible text. If no text is visible, briefly describe what you see instead."
-                    else:
-                        prompt_text = "What do you see in this image from my camera? Please describe what's happening briefly."
-                    
-                    vision_message = {
-                        "role": "user", 
-                        "content": [
-                            {
-                                "type": "text", 
-                                "text": prompt_text
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{encoded_image}"
-                                }
-                            }
-                        ]
-                    }
-                    
-                    temp_conversation = [self.conversation_history[0], vision_message]
-                    
-                    if hasattr(self.ai_client, 'base_url'):
-                        base_url_str = str(self.ai_client.base_url)
-                        model_name = "openai/gpt-4o" if "github" in base_url_str or "models.github.ai" in base_url_str else "gpt-4o"
-                    else:
-                        model_name = "gpt-4o"
-                    
-                    response = self.ai_client.chat.completions.create(
-                        model=model_name,
-                        messages=temp_conversation,
-                        max_tokens=150
-                    )
-                    
-                    vision_description = response.choices[0].message.content
-                    print(f"AI Vision: {vision_description}")
-                    
-                    if not self.last_analysis:
-                        self.last_analysis = {}
-                    
-                    self.last_analysis['timestamp'] = time.time()
-                    self.last_analysis['description'] = vision_description
-                    
-                    # Store the OCR text if OCR is enabled
-                    if self.ocr_enabled and any(word in vision_description.lower() for word in ["text", "says", "reads", "written"]):
-                        self.last_ocr_text = vision_description
-                    
-                    # Detect faces
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    faces = self.face_cascade.detectMultiScale(
-                        gray,
-                        scaleFactor=1.1,
-                        minNeighbors=5,
-                        minSize=(30, 30)
-                    )
-                    self.last_analysis['faces'] = faces
-                    
-                    # Auto narration logic with improved control
-                    if self.auto_narrate and self.speak_callback:
-                        current_time = time.time()
-                        should_speak = False
-                        
-                        # Always speak if it's a new description
-                        if vision_description != self.last_spoken_description:
-                            should_speak = True
-                        
-                        # Check if enough time has passed since last narration
-                        if current_time - self.last_narration_time >= self.narration_interval:
-                            should_speak = True
-                            
-                        if should_speak:
-                            # Prepare the message for speech
-                            if self.ocr_enabled:
-                                if any(word in vision_description.lower() for word in ["text", "says", "reads", "written"]):
-                                    message = f"I can read: {vision_description}"
-                                else:
-                                    message = f"I don't see any clear text. {vision_description}"
-                            else:
-                                message = f"I see: {vision_description}"
-                                
-                            # Call the speech function
-                            self.speak_callback(message)
-                            self.last_spoken_description = vision_description
-                            self.last_narration_time = current_time
-                    
-                except Exception as e:
-                    print(f"ERROR in AI vision loop: {str(e)}")
-                    traceback.print_exc()
-            
+        while self.ai_vision_enabled and self.camera_active and session == self._vision_session:
+            if not self._vision_tick(executor, slots, session, time.time()):
+                break
             time.sleep(0.1)
             
         print("DEBUG: Exited AI vision loop.")
     
-    def _encode_frame_for_ai(self, frame):
-        max_dim = 800
-        height, width = frame.shape[:2]
+    def _vision_tick(self, executor, slots, session, now, wait=None):
+        """
+        Submit the newest frame if a vision request is due at time now.
+        
+        wait is how long to block for a free request slot; without it a full
+        cap skips the tick. Returns False once the pool has been shut down.
+        """
+        if now - self.last_ai_frame_time < self.ai_vision_interval:
+            return True
+        
+        # Local OCR is reading the text; only escalate when it is unsure
+        if self.ocr_enabled and self._local_ocr_is_confident():
+            return True
+        
+        # Respect the concurrency cap; try again on the next tick
+        if not (slots.acquire(timeout=wait) if wait else slots.acquire(blocking=False)):
+            return True
+        
+        # All cameras are tiled into one frame when several are running
+        frame, capture_time, camera_labels = self._snapshot_frames()
+        if frame is None:
+            slots.release()
+            return True
+        
+        # Crop to what moved or carries text when it is worth it
+        roi = None
+        if self.roi_enabled and not camera_labels:
+            roi = self.roi_detector.get_roi(frame.shape, self._recent_text_boxes())
+        
+        self.last_ai_frame_time = now
+        if self._submit_vision_request(executor, session, frame, capture_time, camera_labels, roi,
+                                       slot=slots) is None:
+            return False
+        if self.ocr_enabled and self.local_ocr.is_available:
+            # Local OCR was unsure, so the vision model reads this frame instead
+            self.ocr_stats['escalated'] += 1
+        return True
+    
+    def _replay_step(self):
+        """
+        Run the OCR and vision schedules for the replayed frame just captured.
+        
+        Called on the capture thread, so which frames are read and sent depends
+        only on the recorded timestamps and not on thread timing. A full request
+        cap holds the replay back instead of skipping the frame.
+        """
+        now = self._clock()
+        if self.ocr_enabled and self.local_ocr.is_available and now - self.last_ocr_time >= self.ocr_interval:
+            with self.frame_lock:
+                frame = self.current_frame.copy()
+            try:
+                self._apply_ocr_result(self.local_ocr.read(frame))
+            except Exception as e:
+                print(f"ERROR in local OCR: {str(e)}")
+        
+        executor = self._vision_executor
+        if self.ai_vision_enabled and executor is not None:
+            self._vision_tick(executor, self._inflight_requests, self._vision_session, now,
+                              wait=self.max_result_age)
+    
+    def _submit_vision_request(self, executor, session, frame, capture_time, camera_labels=None, roi=None,
+                               slot=None):
+        """
+        Hand a frame to the request pool and track the future until it finishes.
+        
+        session is the AI vision session the request belongs to; its answer is
+        dropped if vision was restarted meanwhile. slot is the semaphore the
+        caller acquired a slot from, if any, and is released when the request
+        completes. Returns None if the pool was shut down in the meantime.
+        """
+        try:
+            future = executor.submit(self._run_vision_request, session, frame, capture_time, camera_labels, roi)
+        except RuntimeError as e:
+            # Executor was shut down while we were scheduling
+            if slot is not None:
+                slot.release()
+            print(f"DEBUG: Vision request not scheduled: {e}")
+            return None
+        
+        with self._vision_result_lock:
+            self.vision_stats['requests'] += 1
+            # How stale the frame already was when it was handed to the pool
+            self.vision_stats['last_frame_age'] = time.time() - capture_time
+            self._inflight_futures[future] = capture_time
+        
+        def _finished(done):
+            with self._vision_result_lock:
+                self._inflight_futures.pop(done, None)
+            if slot is not None:
+                slot.release()
+        
+        future.add_done_callback(_finished)
+        return future
+    
+    def request_description(self, max_frame_age: float = 1.0) -> Optional[Future]:
+        """
+        Ask for a description of the current view and return its future.
+        
+        A request already in flight for a frame captured within max_frame_age
+        seconds is shared instead of sending a new one. A user question is not
+        held back by the concurrency cap; it only takes a slot when one is free,
+        and the pool keeps a spare worker so it starts straight away.
+        The future resolves to the description, or None if the request failed.
+        Returns None when AI vision is off or there is no frame yet.
+        """
+        executor = self._vision_executor
+        slots = self._inflight_requests
+        session = self._vision_session
+        if not self.ai_vision_enabled or executor is None:
+            return None
+        
+        now = time.time()
+        with self._vision_result_lock:
+            recent = [(t, f) for f, t in self._inflight_futures.items() if now - t <= max_frame_age]
+            if recent:
+                self.vision_stats['reused'] += 1
+                return max(recent, key=lambda item: item[0])[1]
+        
+        frame, capture_time, camera_labels = self._snapshot_frames()
+        if frame is None:
+            return None
+        
+        roi = None
+        if self.roi_enabled and not camera_labels:
+            roi = self.roi_detector.get_roi(frame.shape, self._recent_text_boxes())
+        
+        # This answer also serves the periodic loop, so push its next tick back
+        self.last_ai_frame_time = self._clock()
+        slot = slots if slots.acquire(blocking=False) else None
+        future = self._submit_vision_request(executor, session, frame, capture_time, camera_labels, roi, slot)
+        if future is not None:
+            with self._vision_result_lock:
+                self.vision_stats['on_demand'] += 1
+        return future
+    
+    def describe_now(self, deadline: float = 8.0, max_frame_age: float = 1.0):
+        """
+        Describe the current view, waiting at most deadline seconds for the answer.
         
-        if max(height, width) > max_dim:
-            if height > width:
-                new_height = max_dim
-                new_width = int(width * (max_dim / height))
+        Falls back to the last cached description when the deadline passes or
+        no request could be made.
+        """
+        future = self.request_description(max_frame_age)
+        if future is not None:
+            try:
+                description = future.result(timeout=deadline)
+                if description:
+                    return description
+            except FutureTimeoutError:
+                with self._vision_result_lock:
+                    self.vision_stats['deadline_fallbacks'] += 1
+                print(f"DEBUG: No vision answer within {deadline:.1f}s; using the cached description.")
+        
+        return self.get_latest_ai_description()
+    
+    def _get_vision_model_name(self, client=None):
+        client = client or self.ai_client
+        if hasattr(client, 'base_url'):
+            base_url_str = str(client.base_url)
+            return "openai/gpt-4o" if "github" in base_url_str or "models.github.ai" in base_url_str else "gpt-4o"
+        return "gpt-4o"
+    
+    def _build_vision_message(self, prompt_text, encoded_image, detail=None):
+        """
+        Build a user message with one image, or several when encoded_image is a
+        list; detail may also be a list to set the level per image.
+        """
+        encoded_images = encoded_image if isinstance(encoded_image, list) else [encoded_image]
+        details = detail if isinstance(detail, list) else [detail] * len(encoded_images)
+        content = [
+            {
+                "type": "text", 
+                "text": prompt_text
+            }
+        ]
+        for image, image_detail in zip(encoded_images, details):
+            content.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:image/jpeg;base64,{image}",
+                    "detail": image_detail or self.frame_encoder.detail
+                }
+            })
+        return {
+            "role": "user", 
+            "content": content
+        }
+    
+    def _recent_text_boxes(self):
+        result = self.last_ocr_result
+        if not self.ocr_enabled or not result or self._clock() - self.last_ocr_time > self.ocr_interval * 2 + 1.0:
+            return []
+        return result.get('regions', [])
+    
+    def _encode_roi_for_ai(self, frame, roi):
+        """
+        Encode a region-of-interest crop plus a low-res context thumbnail
+        sharing the usual byte budget; the crop gets most of it.
+        """
+        budget = self.frame_encoder.max_bytes
+        context_budget = int(budget * self.roi_context_share)
+        crop = self._encode_frame_for_ai(frame, roi=roi, max_bytes=budget - context_budget)
+        context = self._encode_frame_for_ai(frame, detail="low", max_bytes=context_budget,
+                                            max_dim=self.roi_context_max_dim)
+        return [crop, context]
+    
+    def _run_vision_request(self, session, frame, capture_time, camera_labels=None, roi=None):
+        """Encode one frame, query the vision model and publish the answer (runs on a pool worker)."""
+        try:
+            if roi is not None:
+                encoded_image = self._encode_roi_for_ai(frame, roi)
+            else:
+                encoded_image = self._encode_frame_for_ai(frame)
+            
+            # Adjust the prompt based on OCR setting
+            if self.ocr_enabled:
+                prompt_text = "What text do you see in this image from my camera? Read any visible text. If no text is visible, briefly describe what you see instead."
             else:
-                new_width = max_dim
-                new_height = int(height * (max_dim / width))
+                prompt_text = "What do you see in this image from my camera? Please describe what's happening briefly."
+            
+            if camera_labels:
+                prompt_text = (f"This image combines {len(camera_labels)} camera views, labelled "
+                               f"{', '.join(camera_labels)}. " + prompt_text +
+                               " Mention which camera shows what.")
+            elif roi is not None:
+                prompt_text += (" The first image is a close-up of the part of the scene that changed;"
+                                " the second is a low-resolution view of the whole scene for context.")
+            
+            detail = [None, "low"] if roi is not None else None
+            vision_message = self._build_vision_message(prompt_text, encoded_image, detail)
+            temp_conversation = [self.conversation_history[0], vision_message]
+            
+            response = self.ai_client.chat.completions.create(
+                model=self._get_vision_model_name(),
+                messages=temp_conversation,
+                max_tokens=150
+            )
+            
+            vision_description = response.choices[0].message.content
+            self._handle_vision_result(vision_description, capture_time, session)
+            return vision_description
+            
+        except Exception as e:
+            with self._vision_result_lock:
+                self.vision_stats['errors'] += 1
+            print(f"ERROR in AI vision request: {str(e)}")
+            traceback.print_exc()
+            return None
+    
+    def _handle_vision_result(self, vision_description, capture_time, session):
+        """Apply a vision answer unless it is stale, superseded, or from an earlier session."""
+        if not self.ai_vision_enabled or session != self._vision_session:
+            return
+        
+        latency = time.time() - capture_time
+        
+        with self._vision_result_lock:
+            if latency > self.max_result_age:
+                self.vision_stats['dropped_stale'] += 1
+                print(f"DEBUG: Dropping stale vision result ({latency:.2f}s old).")
+                return
+            
+            if capture_time <= self._last_applied_capture_time:
+                # A request for a newer frame already answered
+                self.vision_stats['dropped_superseded'] += 1
+                print("DEBUG: Dropping vision result superseded by a newer frame.")
+                return
+            self._last_applied_capture_time = capture_time
+            
+            self.vision_stats['completed'] += 1
+            self.vision_stats['last_latency'] = latency
+            completed = self.vision_stats['completed']
+            previous_avg = self.vision_stats['avg_latency'] or 0.0
+            self.vision_stats['avg_latency'] = previous_avg + (latency - previous_avg) / completed
+            
+            print(f"AI Vision: {vision_description}")
+            print(f"DEBUG: Vision glass-to-answer latency {latency:.2f}s")
+            
+            with self.analysis_lock:
+                if not self.last_analysis:
+                    self.last_analysis = {}
+                
+                self.last_analysis['timestamp'] = time.time()
+                self.last_analysis['frame_time'] = capture_time
+                self.last_analysis['latency'] = latency
+                self.last_analysis['description'] = vision_description
                 
-            frame = cv2.resize(frame, (new_width, new_height))
+                # Faces come from the camera-rate tracking stage
+                self.last_analysis['faces'] = self.face_tracker.get_faces()
+            
+            # Store the OCR text if OCR is enabled and local OCR could not read it
+            ocr_from_vision = (self.ocr_enabled and not self._local_ocr_is_confident() and
+                               any(word in vision_description.lower() for word in ["text", "says", "reads", "written"]))
+            if ocr_from_vision:
+                self.last_ocr_text = vision_description
         
-        success, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        if not success:
-            raise ValueError("Failed to encode image")
+        self.events.publish('description', vision_description, capture_time)
+        if ocr_from_vision:
+            self.events.publish('ocr_text', {'text': vision_description, 'source': 'vision'}, capture_time)
+        self._narrate(vision_description)
+    
+    def _narrate(self, vision_description, message=None):
+        # Auto narration logic with improved control
+        if self.auto_narrate and self.speak_callback:
+            current_time = time.time()
+            should_speak = False
+            
+            # Always speak if it's a new description
+            if vision_description != self.last_spoken_description:
+                should_speak = True
             
-        encoded_image = base64.b64encode(buffer).decode('utf-8')
+            # Check if enough time has passed since last narration
+            if current_time - self.last_narration_time >= self.narration_interval:
+                should_speak = True
+                
+            if should_speak:
+                # Prepare the message for speech unless the caller supplied one
+                if message is None:
+                    if self.ocr_enabled:
+                        if any(word in vision_description.lower() for word in ["text", "says", "reads", "written"]):
+                            message = f"I can read: {vision_description}"
+                        else:
+                            message = f"I don't see any clear text. {vision_description}"
+                    else:
+                        message = f"I see: {vision_description}"
+                    
+                # Skip rewordings of something said moments ago
+                if not self.narration_filter.should_speak(vision_description, message):
+                    print("DEBUG: Suppressed near-duplicate narration.")
+                    return
+                
+                # Call the speech function
+                self.last_spoken_description = vision_description
+                self.last_narration_time = current_time
+                self.speak_callback(message)
+    
+    def describe_motion(self, client=None, conversation_history=None, keyframes=None,
+                        window=None, layout=None, wait=0.0):
+        """
+        Describe what is happening over the last few seconds in one request.
+        
+        Up to `keyframes` frames from the last `window` seconds are chosen by
+        change score and sent together, either tiled into a single grid image
+        ('grid') or as separate images in one message ('multi').
+        
+        With `wait` > 0, first block up to that many seconds for the keyframe
+        history to cover the window, e.g. right after the camera was started.
+        
+        Returns:
+            The model's description, or None if no frames or client are available
+        """
+        client = client or self.ai_client
+        conversation_history = conversation_history or self.conversation_history
+        keyframes = keyframes or self.motion_keyframes
+        window = window or self.motion_window
+        layout = layout or self.motion_layout
+        
+        if client is None or not conversation_history:
+            print("ERROR: describe_motion needs an AI client and conversation history.")
+            return None
+        
+        if wait > 0:
+            self.keyframes.wait_for(int(window / self.keyframes.sample_interval), wait)
+        samples = self.keyframes.select(keyframes, window)
+        if not samples:
+            return None
+        
+        newest = samples[-1][0]
+        labels = [f"{i + 1}: t-{newest - timestamp:.1f}s" for i, (timestamp, _, _) in enumerate(samples)]
+        frames = [frame for _, frame, _ in samples]
+        
+        prompt_text = (f"These are {len(samples)} frames from my camera over the last "
+                       f"{newest - samples[0][0]:.1f} seconds, in time order. "
+                       "Briefly describe what is happening and any movement or actions between the frames.")
+        if layout == "multi":
+            # Low detail keeps each extra image at a fixed, small token cost
+            detail = "low"
+            encoded = [self._encode_frame_for_ai(frame, detail=detail) for frame in frames]
+            prompt_text += f" Frame times: {', '.join(labels)}."
+        else:
+            detail = None
+            encoded = self._encode_frame_for_ai(tile_frames(frames, labels))
+            prompt_text += " Each tile is labelled with its order and age."
+        
+        response = client.chat.completions.create(
+            model=self._get_vision_model_name(client),
+            messages=[conversation_history[0], self._build_vision_message(prompt_text, encoded, detail)],
+            max_tokens=150
+        )
+        description = response.choices[0].message.content
+        print(f"AI Motion Vision: {description}")
+        
+        with self.analysis_lock:
+            if not self.last_analysis:
+                self.last_analysis = {}
+            self.last_analysis['motion_description'] = description
+            self.last_analysis['motion_frames'] = [timestamp for timestamp, _, _ in samples]
+        return description
+    
+    def get_narration_stats(self):
+        """Return how many near-duplicate narrations were suppressed and the TTS calls/audio time saved"""
+        return self.narration_filter.get_stats()
+    
+    def get_vision_stats(self):
+        """Return request, drop and glass-to-answer latency counters for AI vision"""
+        with self._vision_result_lock:
+            return dict(self.vision_stats)
+    
+    def _encode_frame_for_ai(self, frame, roi=None, detail=None, max_bytes=None, max_dim=None):
+        """Encode a frame as base64 JPEG within the frame_encoder byte/token budget."""
+        encoded_image, info = self.frame_encoder.encode(frame, roi=roi, detail=detail,
+                                                        max_bytes=max_bytes, max_dim=max_dim)
+        self.last_encode_info = info
+        print(f"DEBUG: Vision payload {info['bytes'] / 1024:.1f} KB "
+              f"({info['width']}x{info['height']}, q{info['quality']}, ~{info['tokens']} tokens, "
+              f"detail={info['detail']}) encoded in {info['encode_time'] * 1000:.1f} ms")
         return encoded_image
     
+    def set_vision_budget(self, max_bytes=None, max_tokens=None, detail=None):
+        """Adjust the per-request upload budget and the provider detail level ('low', 'high' or 'auto')"""
+        if max_bytes is not None:
+            self.frame_encoder.max_bytes = max_bytes
+        if max_tokens is not None:
+            self.frame_encoder.max_tokens = max_tokens or None
+        if detail is not None:
+            if detail not in ("low", "high", "auto"):
+                raise ValueError(f"Unsupported vision detail level: {detail}")
+            self.frame_encoder.detail = detail
+        return True
+    
     def get_latest_ai_description(self):
         """Get the most recent AI description of what the camera sees"""
-        if self.last_analysis and 'description' in self.last_analysis:
-            return self.last_analysis['description']
+        with self.analysis_lock:
+            if self.last_analysis and 'description' in self.last_analysis:
+                return self.last_analysis['description']
         return None
+    
+    def get_last_analysis(self):
+        """Return a copy of the latest analysis results, or None before the first one"""
+        with self.analysis_lock:
+            return dict(self.last_analysis) if self.last_analysis else None
         
     def get_latest_ocr_text(self):
         """Get the most recent OCR text from the camera"""
@@ -378,6 +1149,4 @@ class CameraManager:
             
     def get_face_count(self):
         """Return the number of faces currently detected"""
-        if self.last_analysis and 'faces' in self.last_analysis:
-            return len(self.last_analysis['faces'])
-        return 0
+        return len(self.face_tracker.get_faces())
@@ -0,0 +1,178 @@
+import os
+import re
+import cv2
+import json
+import glob
+import time
+import platform
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Tuple
+
+
+def _default_cache_path() -> str:
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "camera_cache.json")
+
+
+class CameraDiscovery:
+    """
+    Finds a working camera quickly and remembers it between runs.
+
+    The last device that worked, together with the settings it negotiated, is
+    stored in a small JSON cache and tried first, so a normal start costs a
+    single device open. Only when that fails are the remaining candidates
+    probed, in parallel. On Linux the candidates come straight from
+    ``/dev/video*`` instead of blindly trying indices.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, max_index: int = 5):
+        self.cache_file = cache_file or _default_cache_path()
+        self.max_index = max_index
+        self.is_linux = platform.system() == "Linux"
+
+    def load_cache(self) -> Optional[Dict[str, Any]]:
+        """Return the remembered device entry, or None if there is none."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    cached = json.load(f)
+                if isinstance(cached, dict) and isinstance(cached.get('index'), int):
+                    return cached
+        except Exception as e:
+            print(f"DEBUG: Could not read camera cache {self.cache_file}: {e}")
+        return None
+
+    def save_cache(self, index: int, settings: Dict[str, Any]) -> bool:
+        """Remember a working device and its negotiated settings."""
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump({'index': index, 'settings': settings, 'saved_at': time.time()}, f, indent=4)
+            return True
+        except Exception as e:
+            print(f"DEBUG: Could not write camera cache {self.cache_file}: {e}")
+            return False
+
+    def candidate_indices(self) -> List[int]:
+        """List device indices worth probing, in preferred order."""
+        if not self.is_linux:
+            return list(range(self.max_index))
+
+        indices = []
+        for path in glob.glob('/dev/video*'):
+            match = re.match(r'^/dev/video(\d+)$', path)
+            if not match:
+                continue
+            index = int(match.group(1))
+            # Each UVC camera also exposes a metadata node; only index 0 captures
+            sys_index = f'/sys/class/video4linux/video{index}/index'
+            try:
+                with open(sys_index, 'r') as f:
+                    if f.read().strip() != '0':
+                        continue
+            except OSError:
+                pass
+            indices.append(index)
+        return sorted(indices)
+
+    def _create_capture(self, index: int) -> cv2.VideoCapture:
+        if self.is_linux:
+            # Go straight to V4L2 instead of letting OpenCV try every backend
+            return cv2.VideoCapture(index, cv2.CAP_V4L2)
+        return cv2.VideoCapture(index)
+
+    @staticmethod
+    def apply_settings(capture: cv2.VideoCapture, settings: Dict[str, Any]):
+        """Apply width/height/fps/fourcc/buffer_size settings to an open capture."""
+        if settings.get('fourcc'):
+            capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*settings['fourcc']))
+        if settings.get('width'):
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, settings['width'])
+        if settings.get('height'):
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, settings['height'])
+        if settings.get('fps'):
+            capture.set(cv2.CAP_PROP_FPS, settings['fps'])
+        if settings.get('buffer_size'):
+            # Fewer driver buffers means less queued, stale video
+            capture.set(cv2.CAP_PROP_BUFFERSIZE, settings['buffer_size'])
+
+    @staticmethod
+    def read_settings(capture: cv2.VideoCapture) -> Dict[str, Any]:
+        """Read back the settings the driver actually negotiated."""
+        fourcc_code = int(capture.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((fourcc_code >> (8 * i)) & 0xFF) for i in range(4)) if fourcc_code > 0 else ""
+        return {
+            'width': int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': float(capture.get(cv2.CAP_PROP_FPS)),
+            'fourcc': fourcc if fourcc.isprintable() and fourcc.strip() else "",
+            'buffer_size': int(capture.get(cv2.CAP_PROP_BUFFERSIZE))
+        }
+
+    def open_device(self, index: int, settings: Optional[Dict[str, Any]] = None) -> Optional[cv2.VideoCapture]:
+        """Open one device, apply settings and confirm it delivers a frame."""
+        capture = None
+        try:
+            capture = self._create_capture(index)
+            if not capture.isOpened():
+                capture.release()
+                return None
+            if settings:
+                self.apply_settings(capture, settings)
+            ret, frame = capture.read()
+            if ret and frame is not None:
+                return capture
+            print(f"DEBUG: Camera {index} opened but cannot read frames")
+        except Exception as e:
+            print(f"DEBUG: Exception with camera {index}: {str(e)}")
+        if capture is not None:
+            try:
+                capture.release()
+            except Exception:
+                pass
+        return None
+
+    def probe(self, indices: List[int], settings: Optional[Dict[str, Any]] = None) -> Dict[int, cv2.VideoCapture]:
+        """Open all given indices in parallel and return the ones that work."""
+        if not indices:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(indices), thread_name_prefix="CameraProbe") as pool:
+            results = list(pool.map(lambda i: (i, self.open_device(i, settings)), indices))
+        return {index: capture for index, capture in results if capture is not None}
+
+    def open_camera(self, settings: Optional[Dict[str, Any]] = None) -> Tuple[Optional[cv2.VideoCapture], Optional[int]]:
+        """
+        Open the best available camera.
+
+        Args:
+            settings: Requested width/height/fps/fourcc, used when nothing is cached
+
+        Returns:
+            The open capture and its index, or (None, None) if no camera works
+        """
+        start = time.perf_counter()
+        cached = self.load_cache()
+        candidates = self.candidate_indices()
+
+        if cached is not None:
+            index = cached['index']
+            cached_settings = dict(cached.get('settings') or settings or {})
+            if settings and settings.get('buffer_size'):
+                cached_settings['buffer_size'] = settings['buffer_size']
+            capture = self.open_device(index, cached_settings)
+            if capture is not None:
+                print(f"DEBUG: Opened cached camera {index} in {(time.perf_counter() - start) * 1000:.0f} ms")
+                return capture, index
+            print(f"DEBUG: Cached camera {index} is no longer available, probing others...")
+            candidates = [i for i in candidates if i != index]
+
+        opened = self.probe(candidates, settings)
+        if not opened:
+            return None, None
+
+        # Keep the first working device in preference order and free the rest
+        index = min(opened, key=candidates.index)
+        for other, capture in opened.items():
+            if other != index:
+                capture.release()
+
+        print(f"DEBUG: Discovered camera {index} in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return opened[index], index
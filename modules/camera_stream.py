@@ -0,0 +1,146 @@
+import cv2
+import math
+import time
+import threading
+from typing import Optional, Dict, List, Any, Tuple
+import numpy as np
+
+
+class CameraStream:
+    """
+    One open camera with its own capture thread and latest-frame buffer.
+
+    ``CameraManager`` keeps one of these per device. The capture thread writes
+    into the buffer under ``lock`` and updates the per-camera fps and read
+    latency figures reported by ``get_stats``.
+
+    In low-latency mode frames are read with a separate grab and retrieve: a
+    grab that returns almost immediately was served from the driver queue
+    rather than the sensor, so it is skipped without paying for a decode.
+    Each frame is stamped with the time its grab completed.
+    """
+
+    def __init__(self, index: int, capture: cv2.VideoCapture, primary: bool = False):
+        self.index = index
+        self.capture = capture
+        self.primary = primary
+        self.display: bool = True
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self.frame: Optional[np.ndarray] = None
+        self.frame_time: float = 0
+        self.frames: int = 0
+        self.failures: int = 0
+        self.fps: float = 0.0
+        self.read_latency: float = 0.0
+        self.low_latency: bool = False
+        self.backlog_threshold: float = 0.004
+        self.max_backlog_skip: int = 3
+        self.backlog_dropped: int = 0
+        self.decode_latency: float = 0.0
+        self._last_frame_time: float = 0
+
+    @property
+    def window_name(self) -> str:
+        return 'Liam Camera' if self.primary else f'Liam Camera {self.index}'
+
+    @property
+    def is_open(self) -> bool:
+        return self.capture is not None and self.capture.isOpened()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray], float]:
+        """Read the next frame and return (ok, frame, capture_time)."""
+        if not self.low_latency:
+            ret, frame = self.capture.read()
+            return ret, frame, time.time()
+
+        start = time.time()
+        ok = self.capture.grab()
+        grabbed = time.time()
+        skipped = 0
+        while ok and grabbed - start < self.backlog_threshold and skipped < self.max_backlog_skip:
+            # Served from the queue; grab again to get to the newest frame
+            start = grabbed
+            ok = self.capture.grab()
+            grabbed = time.time()
+            skipped += 1
+        self.backlog_dropped += skipped
+        if not ok:
+            return False, None, grabbed
+
+        ret, frame = self.capture.retrieve()
+        decode_time = time.time() - grabbed
+        self.decode_latency = decode_time if not self.frames else self.decode_latency * 0.9 + decode_time * 0.1
+        return ret, frame, grabbed
+
+    def record_frame(self, frame: np.ndarray, frame_time: float, read_time: float):
+        """Store a new frame and update the rolling fps/latency figures."""
+        with self.lock:
+            self.frame = frame
+            self.frame_time = frame_time
+
+        if self._last_frame_time:
+            interval = frame_time - self._last_frame_time
+            if interval > 0:
+                self.fps = 1.0 / interval if not self.fps else self.fps * 0.9 + (1.0 / interval) * 0.1
+        self.read_latency = read_time if not self.frames else self.read_latency * 0.9 + read_time * 0.1
+        self._last_frame_time = frame_time
+        self.frames += 1
+
+    def latest(self) -> Tuple[Optional[np.ndarray], float]:
+        """Return a copy of the newest frame and its capture time."""
+        with self.lock:
+            if self.frame is None:
+                return None, 0
+            return self.frame.copy(), self.frame_time
+
+    def get_stats(self) -> Dict[str, Any]:
+        age = time.time() - self.frame_time if self.frame_time else None
+        return {
+            'index': self.index,
+            'primary': self.primary,
+            'frames': self.frames,
+            'failures': self.failures,
+            'fps': round(self.fps, 1),
+            'read_latency_ms': round(self.read_latency * 1000, 1),
+            'frame_age_ms': round(age * 1000, 1) if age is not None else None,
+            'low_latency': self.low_latency,
+            'decode_latency_ms': round(self.decode_latency * 1000, 1),
+            'backlog_dropped': self.backlog_dropped
+        }
+
+    def release(self):
+        if self.capture is not None:
+            try:
+                self.capture.release()
+            except Exception as e:
+                print(f"DEBUG: Error releasing camera {self.index}: {e}")
+
+
+def tile_frames(frames: List[np.ndarray], labels: Optional[List[str]] = None,
+                tile_width: int = 640) -> np.ndarray:
+    """
+    Combine several frames into one grid image so they can share a single
+    vision request. Tiles keep the first frame's aspect ratio and are labelled
+    in the top-left corner when ``labels`` is given.
+    """
+    if len(frames) == 1 and not labels:
+        return frames[0]
+
+    first_h, first_w = frames[0].shape[:2]
+    tile_height = max(1, int(tile_width * first_h / float(first_w)))
+    cols = int(math.ceil(math.sqrt(len(frames))))
+    rows = int(math.ceil(len(frames) / float(cols)))
+
+    grid = np.zeros((rows * tile_height, cols * tile_width, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        row, col = divmod(i, cols)
+        y, x = row * tile_height, col * tile_width
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        tile = cv2.resize(frame, (tile_width, tile_height), interpolation=cv2.INTER_AREA)
+        if labels:
+            cv2.putText(tile, labels[i], (8, 28), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 4)
+            cv2.putText(tile, labels[i], (8, 28), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        grid[y:y + tile_height, x:x + tile_width] = tile
+    return grid
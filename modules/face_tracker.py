@@ -0,0 +1,122 @@
+import cv2
+import threading
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+class FaceTracker:
+    """
+    Keeps face boxes fresh at camera rate without running the Haar cascade on
+    every full-resolution frame.
+
+    The cascade runs on a downscaled grayscale frame every ``detect_every``
+    frames. In between, each face is followed by template matching inside a
+    small search window around its last position, which costs a fraction of a
+    full detection pass.
+    """
+
+    def __init__(self, cascade, detect_every: int = 10,
+                 detect_width: int = 320, search_margin: float = 0.5,
+                 min_match_score: float = 0.55):
+        self.cascade = cascade
+        self.detect_every = max(1, detect_every)
+        self.detect_width = detect_width
+        self.search_margin = search_margin
+        self.min_match_score = min_match_score
+        self.frame_index: int = 0
+        self.detections: int = 0
+        self.tracked_updates: int = 0
+        self._lock = threading.Lock()
+        self._faces: List[Tuple[int, int, int, int]] = []
+        # Boxes and templates are kept in downscaled coordinates
+        self._tracks: List[Tuple[Tuple[int, int, int, int], np.ndarray]] = []
+        self._force_detect: bool = True
+        self._small: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+
+    def _prepare(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
+        height, width = frame.shape[:2]
+        scale = min(1.0, self.detect_width / float(width))
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        # Reuse the scratch buffers between frames when the size is unchanged
+        if self._small is None or self._small.shape[1::-1] != size:
+            self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._gray = np.empty((size[1], size[0]), dtype=np.uint8)
+
+        if scale < 1.0:
+            cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray, scale
+
+    def _detect(self, gray: np.ndarray, scale: float):
+        min_side = max(12, int(30 * scale))
+        boxes = self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(min_side, min_side)
+        )
+        self._tracks = []
+        for (x, y, w, h) in boxes:
+            template = gray[y:y + h, x:x + w].copy()
+            self._tracks.append(((int(x), int(y), int(w), int(h)), template))
+        self.detections += 1
+
+    def _track(self, gray: np.ndarray):
+        img_h, img_w = gray.shape[:2]
+        survivors = []
+        for (x, y, w, h), template in self._tracks:
+            mx = int(w * self.search_margin)
+            my = int(h * self.search_margin)
+            x0, y0 = max(0, x - mx), max(0, y - my)
+            x1, y1 = min(img_w, x + w + mx), min(img_h, y + h + my)
+            window = gray[y0:y1, x0:x1]
+            if window.shape[0] < h or window.shape[1] < w:
+                continue
+
+            result = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+            _, score, _, location = cv2.minMaxLoc(result)
+            if score < self.min_match_score:
+                continue
+            survivors.append(((x0 + location[0], y0 + location[1], w, h), template))
+
+        if len(survivors) < len(self._tracks):
+            # A face was lost, so look again on the next frame
+            self._force_detect = True
+        self._tracks = survivors
+        self.tracked_updates += 1
+
+    def update(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Advance the tracker by one camera frame and return full-resolution boxes."""
+        gray, scale = self._prepare(frame)
+
+        if self._force_detect or self.frame_index % self.detect_every == 0:
+            self._detect(gray, scale)
+            self._force_detect = False
+        elif self._tracks:
+            self._track(gray)
+
+        self.frame_index += 1
+
+        inv = 1.0 / scale
+        faces = [(int(x * inv), int(y * inv), int(w * inv), int(h * inv))
+                 for (x, y, w, h), _ in self._tracks]
+        with self._lock:
+            self._faces = faces
+        return faces
+
+    def get_faces(self) -> List[Tuple[int, int, int, int]]:
+        """Return the most recent face boxes in full-resolution coordinates."""
+        with self._lock:
+            return list(self._faces)
+
+    def reset(self):
+        """Drop all tracks so the next frame triggers a fresh detection."""
+        with self._lock:
+            self._faces = []
+        self._tracks = []
+        self._force_detect = True
+        self.frame_index = 0
@@ -0,0 +1,165 @@
+import cv2
+import math
+import time
+import base64
+import threading
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+
+
+class FrameEncoder:
+    """
+    JPEG encoder for vision requests that keeps each upload inside a budget.
+
+    Frames are downscaled with area interpolation, optionally cropped to a
+    region of interest, and the JPEG quality is searched so the payload fits
+    ``max_bytes``. When ``max_tokens`` is set the output size is also limited
+    so the provider's image token estimate stays under it.
+    """
+
+    # Image token accounting used by the OpenAI vision models
+    LOW_DETAIL_TOKENS = 85
+    TILE_TOKENS = 170
+    TILE_SIZE = 512
+    LOW_DETAIL_MAX_DIM = 512
+
+    def __init__(self, max_bytes: int = 60000, max_tokens: Optional[int] = None,
+                 max_dim: int = 800, min_quality: int = 35, max_quality: int = 85,
+                 detail: str = "auto"):
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.max_dim = max_dim
+        self.min_quality = min_quality
+        self.max_quality = max_quality
+        self.detail = detail
+        self.last_quality: int = max_quality
+        self._resize_buffer: Optional[np.ndarray] = None
+        # The scratch buffer is shared, so encodes from different threads take turns
+        self._lock = threading.Lock()
+
+    @classmethod
+    def estimate_tokens(cls, width: int, height: int, detail: str = "high") -> int:
+        """Estimate the prompt tokens an image of this size costs at the given detail level."""
+        if detail == "low":
+            return cls.LOW_DETAIL_TOKENS
+
+        # The provider fits the image in 2048x2048, then scales the short side to 768
+        scale = min(1.0, 2048.0 / max(width, height))
+        width, height = width * scale, height * scale
+        scale = min(1.0, 768.0 / min(width, height))
+        width, height = width * scale, height * scale
+
+        tiles = math.ceil(width / cls.TILE_SIZE) * math.ceil(height / cls.TILE_SIZE)
+        return cls.LOW_DETAIL_TOKENS + cls.TILE_TOKENS * tiles
+
+    def _target_size(self, width: int, height: int, detail: str,
+                     max_dim: Optional[int] = None) -> Tuple[int, int]:
+        max_dim = max_dim or self.max_dim
+        if detail == "low":
+            max_dim = min(max_dim, self.LOW_DETAIL_MAX_DIM)
+        scale = min(1.0, max_dim / float(max(width, height)))
+
+        if self.max_tokens and detail != "low":
+            while scale > 0.1 and self.estimate_tokens(int(width * scale), int(height * scale)) > self.max_tokens:
+                scale *= 0.9
+
+        return max(1, int(width * scale)), max(1, int(height * scale))
+
+    def _resize(self, frame: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+        if frame.shape[1::-1] == size:
+            return frame
+
+        shape = (size[1], size[0]) + frame.shape[2:]
+        if self._resize_buffer is None or self._resize_buffer.shape != shape:
+            self._resize_buffer = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, size, dst=self._resize_buffer, interpolation=cv2.INTER_AREA)
+        return self._resize_buffer
+
+    def _jpeg(self, image: np.ndarray, quality: int) -> np.ndarray:
+        success, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not success:
+            raise ValueError("Failed to encode image")
+        return buffer
+
+    def _search_quality(self, image: np.ndarray, max_bytes: int,
+                        start_quality: Optional[int] = None) -> Tuple[Optional[np.ndarray], int]:
+        # Most frames look like the previous one, so try its quality first
+        if start_quality is not None:
+            buffer = self._jpeg(image, start_quality)
+            if buffer.size <= max_bytes and (buffer.size >= max_bytes * 0.85 or start_quality >= self.max_quality):
+                return buffer, start_quality
+
+        best, best_quality = None, self.min_quality
+        low, high = self.min_quality, self.max_quality
+        while low <= high:
+            quality = (low + high) // 2
+            buffer = self._jpeg(image, quality)
+            if buffer.size <= max_bytes:
+                best, best_quality = buffer, quality
+                low = quality + 1
+            else:
+                high = quality - 1
+        return best, best_quality
+
+    def encode(self, frame: np.ndarray, roi: Optional[Tuple[int, int, int, int]] = None,
+               detail: Optional[str] = None, max_bytes: Optional[int] = None,
+               max_dim: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Encode a BGR frame to a base64 JPEG that fits the byte budget.
+
+        Args:
+            frame: Image to encode
+            roi: Optional (x, y, w, h) crop applied before scaling
+            detail: 'low', 'high' or 'auto'; defaults to the encoder setting
+            max_bytes: Byte budget for this image; defaults to the encoder setting
+            max_dim: Longest side for this image; defaults to the encoder setting
+
+        Returns:
+            The base64 string and a dictionary describing the payload
+        """
+        with self._lock:
+            return self._encode(frame, roi, detail or self.detail, max_bytes or self.max_bytes, max_dim)
+
+    def _encode(self, frame: np.ndarray, roi: Optional[Tuple[int, int, int, int]],
+                detail: str, max_bytes: int, max_dim: Optional[int]) -> Tuple[str, Dict[str, Any]]:
+        start = time.perf_counter()
+        # Only full-budget encodes feed the quality hint for the next frame
+        default_budget = max_bytes == self.max_bytes and not max_dim
+
+        if roi is not None:
+            x, y, w, h = roi
+            frame = frame[max(0, y):y + h, max(0, x):x + w]
+
+        height, width = frame.shape[:2]
+        size = self._target_size(width, height, detail, max_dim)
+
+        buffer, quality = None, self.min_quality
+        for _ in range(4):
+            image = self._resize(frame, size)
+            buffer, quality = self._search_quality(image, max_bytes,
+                                                   self.last_quality if default_budget else None)
+            if buffer is not None:
+                break
+            # Even the lowest quality is over budget, so shrink and retry
+            size = (max(1, int(size[0] * 0.75)), max(1, int(size[1] * 0.75)))
+
+        if buffer is None:
+            buffer = self._jpeg(self._resize(frame, size), self.min_quality)
+            quality = self.min_quality
+        if default_budget:
+            self.last_quality = quality
+
+        encoded_image = base64.b64encode(memoryview(buffer)).decode('ascii')
+
+        info = {
+            'bytes': int(buffer.size),
+            'base64_bytes': len(encoded_image),
+            'width': size[0],
+            'height': size[1],
+            'quality': quality,
+            'detail': detail,
+            'tokens': self.estimate_tokens(size[0], size[1], "low" if detail == "low" else "high"),
+            'encode_time': time.perf_counter() - start,
+            'roi': roi
+        }
+        return encoded_image, info
@@ -0,0 +1,194 @@
+import time
+import struct
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+MAGIC = b"LIAMSHM1"
+VERSION = 1
+# magic, version, slot count, slot capacity in bytes, reserved, latest sequence
+HEADER = struct.Struct("<8sIIIIQ")
+# sequence (0 while being written), capture timestamp, height, width, channels
+SLOT_HEADER = struct.Struct("<QdIII4x")
+ALIGN = 64
+
+
+def _aligned(size: int) -> int:
+    return (size + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, create=False, track=False)
+    except TypeError:
+        # Before Python 3.13 an attaching process registers the segment with its
+        # resource tracker, which would unlink it on exit; undo that
+        shm = shared_memory.SharedMemory(name=name, create=False)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+class SharedFrameWriter:
+    """
+    Publishes camera frames into a named shared-memory ring.
+
+    The segment starts with a header (magic, slot count, slot capacity and
+    the latest sequence number) followed by ``slots`` fixed-size slots. Each
+    slot carries its own sequence, capture timestamp and frame shape ahead
+    of the pixel data. A slot's sequence is zeroed while it is rewritten, so
+    readers can tell a torn frame from a complete one.
+    """
+
+    def __init__(self, name: str = "liam_camera", slots: int = 4, max_width: int = 1920,
+                 max_height: int = 1080, channels: int = 3):
+        self.name = name
+        self.slots = max(2, slots)
+        self.slot_capacity = max_width * max_height * channels
+        self.slot_size = _aligned(SLOT_HEADER.size) + _aligned(self.slot_capacity)
+        self.data_offset = _aligned(HEADER.size)
+        self.sequence: int = 0
+        self.written: int = 0
+        self.skipped: int = 0
+        self._lock = threading.Lock()
+
+        size = self.data_offset + self.slot_size * self.slots
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over from a run that did not shut down cleanly
+            stale = shared_memory.SharedMemory(name=name, create=False)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        HEADER.pack_into(self._shm.buf, 0, MAGIC, VERSION, self.slots, self.slot_capacity, 0, 0)
+        print(f"DEBUG: Sharing frames in shared memory '{name}' ({self.slots} slots, {size / 1e6:.1f} MB)")
+
+    def _slot_offset(self, slot: int) -> int:
+        return self.data_offset + slot * self.slot_size
+
+    def write(self, frame: np.ndarray, timestamp: Optional[float] = None) -> Optional[int]:
+        """Copy a uint8 frame into the next slot and return its sequence number, or None if it does not fit."""
+        if frame.dtype != np.uint8 or frame.nbytes > self.slot_capacity:
+            self.skipped += 1
+            return None
+
+        with self._lock:
+            if self._shm is None:
+                return None
+            return self._write(frame, timestamp)
+
+    def _write(self, frame: np.ndarray, timestamp: Optional[float]) -> int:
+        self.sequence += 1
+        offset = self._slot_offset(self.sequence % self.slots)
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        buf = self._shm.buf
+
+        SLOT_HEADER.pack_into(buf, offset, 0, 0.0, 0, 0, 0)
+        data_offset = offset + _aligned(SLOT_HEADER.size)
+        target = np.ndarray(frame.shape, dtype=np.uint8, buffer=buf, offset=data_offset)
+        np.copyto(target, frame)
+        SLOT_HEADER.pack_into(buf, offset, self.sequence, timestamp or time.time(), height, width, channels)
+        struct.pack_into("<Q", buf, HEADER.size - 8, self.sequence)
+
+        self.written += 1
+        return self.sequence
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'name': self.name, 'sequence': self.sequence, 'written': self.written, 'skipped': self.skipped}
+
+    def close(self):
+        """Release and remove the shared-memory segment."""
+        with self._lock:
+            if self._shm is None:
+                return
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+
+class SharedFrameReader:
+    """
+    Reads frames published by ``SharedFrameWriter`` from another process.
+
+    ``read_latest(copy=False)`` returns a numpy view straight into shared
+    memory. The view stays valid until the writer wraps around the ring
+    (``slots - 1`` frames later); ``is_current(info)`` tells whether it
+    still holds the frame that was read.
+    """
+
+    def __init__(self, name: str = "liam_camera"):
+        self.name = name
+        self._shm = _open_shared_memory(name)
+        magic, version, self.slots, self.slot_capacity, _, _ = HEADER.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory '{name}' does not hold a Liam frame ring")
+        self.slot_size = _aligned(SLOT_HEADER.size) + _aligned(self.slot_capacity)
+        self.data_offset = _aligned(HEADER.size)
+
+    @property
+    def latest_sequence(self) -> int:
+        return struct.unpack_from("<Q", self._shm.buf, HEADER.size - 8)[0]
+
+    def _slot_offset(self, sequence: int) -> int:
+        return self.data_offset + (sequence % self.slots) * self.slot_size
+
+    def read(self, sequence: int, copy: bool = False) -> Tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]:
+        """Read one frame by sequence number; returns (None, None) once it has been overwritten."""
+        if sequence <= 0:
+            return None, None
+        offset = self._slot_offset(sequence)
+        slot_sequence, timestamp, height, width, channels = SLOT_HEADER.unpack_from(self._shm.buf, offset)
+        if slot_sequence != sequence:
+            return None, None
+
+        shape = (height, width, channels) if channels > 1 else (height, width)
+        frame = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf,
+                           offset=offset + _aligned(SLOT_HEADER.size))
+        if copy:
+            frame = frame.copy()
+            # The writer may have started on this slot while we copied
+            if SLOT_HEADER.unpack_from(self._shm.buf, offset)[0] != sequence:
+                return None, None
+
+        info = {'sequence': sequence, 'timestamp': timestamp, 'age': time.time() - timestamp, 'shape': shape}
+        return frame, info
+
+    def read_latest(self, copy: bool = False) -> Tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]:
+        """Return the newest complete frame and its info, or (None, None) if none is available."""
+        sequence = self.latest_sequence
+        frame, info = self.read(sequence, copy)
+        if frame is None and sequence > 1:
+            # Lost a race with the writer; the previous slot is complete
+            frame, info = self.read(sequence - 1, copy)
+        return frame, info
+
+    def wait_for_frame(self, after_sequence: int = 0, timeout: float = 1.0, poll_interval: float = 0.002,
+                       copy: bool = False) -> Tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]:
+        """Wait until a frame newer than after_sequence is published and return it."""
+        deadline = time.time() + timeout
+        while self.latest_sequence <= after_sequence:
+            if time.time() >= deadline:
+                return None, None
+            time.sleep(poll_interval)
+        return self.read_latest(copy)
+
+    def is_current(self, info: Dict[str, Any]) -> bool:
+        """True while the slot still holds the frame described by info."""
+        offset = self._slot_offset(info['sequence'])
+        return SLOT_HEADER.unpack_from(self._shm.buf, offset)[0] == info['sequence']
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
@@ -0,0 +1,96 @@
+import cv2
+import time
+import threading
+from collections import deque
+from typing import List, Tuple
+import numpy as np
+
+
+class KeyframeBuffer:
+    """
+    Short history of sampled frames with a change score per sample.
+
+    The capture loop offers every frame; one is kept every ``sample_interval``
+    seconds at ``store_width`` pixels wide. Each kept sample is scored by the
+    mean absolute difference of a tiny grayscale thumbnail against the
+    previous sample, so motion-heavy moments can be picked out cheaply.
+    """
+
+    def __init__(self, history_seconds: float = 10.0, sample_interval: float = 0.25,
+                 store_width: int = 480, thumb_size: Tuple[int, int] = (64, 48)):
+        self.sample_interval = sample_interval
+        self.store_width = store_width
+        self.thumb_size = thumb_size
+        self._samples = deque(maxlen=max(2, int(history_seconds / sample_interval)))
+        self._lock = threading.Condition()
+        self._last_sample_time: float = 0
+        self._last_thumb = None
+
+    def offer(self, frame: np.ndarray, frame_time: float):
+        """
+        Consider a capture frame for the history (cheap when not sampled).
+
+        Returns the change score of the kept sample, or None if the frame was skipped.
+        """
+        if frame_time - self._last_sample_time < self.sample_interval:
+            return None
+        self._last_sample_time = frame_time
+
+        height, width = frame.shape[:2]
+        if width > self.store_width:
+            stored = cv2.resize(frame, (self.store_width, int(height * self.store_width / float(width))),
+                                interpolation=cv2.INTER_AREA)
+        else:
+            stored = frame.copy()
+
+        thumb = cv2.cvtColor(cv2.resize(stored, self.thumb_size, interpolation=cv2.INTER_AREA),
+                             cv2.COLOR_BGR2GRAY)
+        score = float(cv2.absdiff(thumb, self._last_thumb).mean()) if self._last_thumb is not None else 0.0
+        self._last_thumb = thumb
+
+        with self._lock:
+            self._samples.append((frame_time, stored, score))
+            self._lock.notify_all()
+        return score
+
+    def select(self, count: int, window: float) -> List[Tuple[float, np.ndarray, float]]:
+        """
+        Choose up to ``count`` keyframes from the last ``window`` seconds.
+
+        The oldest and newest samples anchor the sequence; the remaining slots
+        go to the samples with the highest change scores. Results are returned
+        in time order as (timestamp, frame, change_score).
+        """
+        cutoff = time.time() - window
+        with self._lock:
+            samples = [s for s in self._samples if s[0] >= cutoff]
+
+        if len(samples) <= count:
+            return samples
+        if count <= 1:
+            return samples[-1:]
+
+        chosen = {0, len(samples) - 1}
+        middle = sorted(range(1, len(samples) - 1), key=lambda i: samples[i][2], reverse=True)
+        for i in middle:
+            if len(chosen) >= count:
+                break
+            chosen.add(i)
+        return [samples[i] for i in sorted(chosen)]
+
+    def wait_for(self, count: int, timeout: float) -> int:
+        """Block until at least ``count`` samples are held or ``timeout`` seconds pass; returns how many are held."""
+        deadline = time.time() + timeout
+        with self._lock:
+            while len(self._samples) < count:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._lock.wait(remaining)
+            return len(self._samples)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+        self._last_thumb = None
+        self._last_sample_time = 0
@@ -0,0 +1,195 @@
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+import numpy as np
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsServer:
+    """
+    Optional local HTTP endpoint exposing TaskManager data.
+
+    ``/metrics`` serves Prometheus text format and ``/metrics.json`` the same
+    data as JSON; both accept ``?window=<seconds>`` for the averaging window.
+    Every response is built from what the TaskManager's background sampler
+    already holds (the latest system sample and its last process snapshot),
+    so a scrape never enumerates processes itself. A rendered body is reused
+    until the sampler takes its next sample.
+
+    Per-process series are limited to the ``max_processes`` heaviest
+    processes by CPU and by memory to keep the series count bounded.
+    """
+
+    def __init__(self, task_manager, host: str = "127.0.0.1", port: int = 9105, max_processes: int = 25):
+        self.task_manager = task_manager
+        self.host = host
+        self.port = port
+        self.max_processes = max_processes
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+        self.requests: int = 0
+        self._cache: Dict[Tuple[str, float], Tuple[tuple, bytes]] = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self) -> bool:
+        if self.is_running:
+            return False
+        try:
+            self.server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        except OSError as e:
+            print(f"ERROR starting metrics endpoint on {self.host}:{self.port}: {str(e)}")
+            self.server = None
+            return False
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name="MetricsServer")
+        self.thread.daemon = True
+        self.thread.start()
+        print(f"DEBUG: Metrics endpoint at http://{self.host}:{self.port}/metrics")
+        return True
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def _make_handler(self):
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                try:
+                    window = float(parse_qs(url.query).get('window', ['1'])[0])
+                except ValueError:
+                    window = 1.0
+                if url.path == '/metrics':
+                    body, content_type = metrics.render('prometheus', window), PROMETHEUS_CONTENT_TYPE
+                elif url.path == '/metrics.json':
+                    body, content_type = metrics.render('json', window), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Scrapes would otherwise be printed to the console every few seconds
+                pass
+
+        return Handler
+
+    def render(self, fmt: str, window: float = 1) -> bytes:
+        """Render the current data as 'prometheus' or 'json', reusing the body until the next sample."""
+        sampler = self.task_manager.sampler
+        window = min(max(window, sampler.interval), sampler.capacity * sampler.interval)
+        version = (sampler.samples, id(sampler.process_snapshot))
+        key = (fmt, window)
+        with self._cache_lock:
+            self.requests += 1
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+        data = self.collect(window)
+        if fmt == 'json':
+            body = json.dumps(data, default=str).encode()
+        else:
+            body = self._render_prometheus(data).encode()
+        with self._cache_lock:
+            if len(self._cache) >= 16:
+                self._cache.clear()
+            self._cache[key] = (version, body)
+        return body
+
+    def _top_processes(self) -> List[Dict[str, Any]]:
+        snapshot = self.task_manager.sampler.process_snapshot
+        if snapshot is None:
+            return []
+        rows = np.union1d(snapshot.top_k(self.max_processes, 'cpu_percent'),
+                          snapshot.top_k(self.max_processes, 'memory_percent'))
+        return [{
+            'pid': int(snapshot.pid[row]),
+            'name': snapshot.name(row),
+            'cpu_percent': round(float(snapshot.cpu[row]), 2),
+            'memory_percent': round(float(snapshot.memory[row]), 3)
+        } for row in rows]
+
+    def collect(self, window: float = 1) -> Dict[str, Any]:
+        """Gather host and process figures from the sampler's cached data."""
+        snapshot = self.task_manager.sampler.process_snapshot
+        return {
+            'timestamp': time.time(),
+            'host': self.task_manager.get_system_resource_usage(window),
+            'process_count': len(snapshot) if snapshot is not None else None,
+            'processes': self._top_processes(),
+            'anomalies': self.task_manager.get_anomalies(limit=10, min_score=3.0),
+            'sampler': self.task_manager.sampler.get_stats()
+        }
+
+    @staticmethod
+    def _render_prometheus(data: Dict[str, Any]) -> str:
+        lines: List[str] = []
+
+        def metric(name, help_text, samples, kind='gauge'):
+            samples = [(labels, value) for labels, value in samples if value is not None]
+            if not samples:
+                return
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        host = data['host']
+        window = {'window': f"{host['window']:g}s"}
+        metric("liam_cpu_percent", "System CPU usage averaged over the window.", [(window, host['cpu_percent'])])
+        metric("liam_cpu_core_percent", "Per-core CPU usage averaged over the window.",
+               [(dict(window, core=i), value) for i, value in enumerate(host['per_core_cpu'] or [])])
+        if host['load_average']:
+            metric("liam_load_average", "System load average.",
+                   [({'period': period}, round(value, 2)) for period, value in zip(("1m", "5m", "15m"), host['load_average'])])
+        metric("liam_memory_percent", "Memory in use.", [({}, host['memory']['percent'])])
+        metric("liam_memory_total_bytes", "Total physical memory.", [({}, host['memory']['total'])])
+        metric("liam_memory_available_bytes", "Memory available without swapping.", [({}, host['memory']['available'])])
+        metric("liam_swap_percent", "Swap in use.", [({}, host['swap']['percent'])])
+        metric("liam_swap_used_bytes", "Swap used.", [({}, host['swap']['used'])])
+        metric("liam_disk_percent", "System disk space in use.", [({}, host['disk']['percent'])])
+        metric("liam_disk_free_bytes", "System disk space free.", [({}, host['disk']['free'])])
+        metric("liam_disk_io_bytes_per_second", "Disk throughput over the window.",
+               [(dict(window, direction='read'), host['disk_io']['read_bytes_per_sec']),
+                (dict(window, direction='write'), host['disk_io']['write_bytes_per_sec'])])
+        metric("liam_network_bytes_per_second", "Network throughput over the window.",
+               [(dict(window, direction='receive'), host['network']['recv_bytes_per_sec']),
+                (dict(window, direction='transmit'), host['network']['sent_bytes_per_sec'])])
+        metric("liam_processes", "Number of running processes.", [({}, data['process_count'])])
+
+        processes = data['processes']
+        metric("liam_process_cpu_percent", "CPU usage of the heaviest processes.",
+               [({'pid': p['pid'], 'name': p['name']}, p['cpu_percent']) for p in processes])
+        metric("liam_process_memory_percent", "Memory usage of the heaviest processes.",
+               [({'pid': p['pid'], 'name': p['name']}, p['memory_percent']) for p in processes])
+        metric("liam_process_anomaly_score", "Processes whose resource use stands out from their baseline.",
+               [({'pid': a['pid'], 'name': a['name'], 'metric': a['metric']}, round(a['score'], 2))
+                for a in data['anomalies']])
+        metric("liam_sampler_samples_total", "Background samples taken.", [({}, data['sampler']['samples'])], 'counter')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,100 @@
+import re
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Set, Tuple
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "with", "is", "are",
+    "was", "be", "it", "its", "this", "that", "there", "i", "you", "can", "see", "some",
+    "appears", "seems", "image", "camera", "view", "which", "what", "as", "by", "for"
+}
+
+
+class NarrationFilter:
+    """
+    Suppresses auto-narrations that only reword something said recently.
+
+    Each narration is reduced to a set of word shingles (single content words
+    by default, i.e. a token set) and compared by Jaccard similarity against a
+    short window of recent narrations. Suppressed lines are counted together
+    with the TTS calls and estimated audio time they saved.
+    """
+
+    def __init__(self, threshold: float = 0.6, window: int = 5, memory_seconds: float = 30.0,
+                 shingle_size: int = 1, words_per_minute: float = 150.0):
+        self.threshold = threshold
+        self.memory_seconds = memory_seconds
+        self.shingle_size = max(1, shingle_size)
+        self.words_per_minute = words_per_minute
+        self.suppressed: int = 0
+        self.tts_calls_saved: int = 0
+        self.audio_seconds_saved: float = 0.0
+        self._recent = deque(maxlen=max(1, window))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stem(word: str) -> str:
+        # Crude suffix stripping so "sits" and "sitting" line up with "sit"
+        for suffix in ("ing", "ed", "es", "s"):
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                word = word[:-len(suffix)]
+                if suffix in ("ing", "ed") and len(word) > 3 and word[-1] == word[-2]:
+                    word = word[:-1]
+                break
+        return word
+
+    def _shingles(self, text: str) -> Set[Tuple[str, ...]]:
+        words = [self._stem(w) for w in re.findall(r"[a-z0-9']+", text.lower()) if w not in STOPWORDS]
+        k = self.shingle_size
+        if len(words) < k:
+            return {tuple(words)} if words else set()
+        return {tuple(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    @staticmethod
+    def jaccard(a: Set, b: Set) -> float:
+        if not a and not b:
+            return 1.0
+        return len(a & b) / float(len(a | b))
+
+    def similarity(self, text: str) -> float:
+        """Highest similarity between text and the recent narrations still in memory."""
+        shingles = self._shingles(text)
+        cutoff = time.time() - self.memory_seconds
+        with self._lock:
+            scores = [self.jaccard(shingles, s) for t, s in self._recent if t >= cutoff]
+        return max(scores) if scores else 0.0
+
+    def should_speak(self, text: str, message: Optional[str] = None) -> bool:
+        """
+        Decide whether a narration is new enough to speak and record it if so.
+
+        Args:
+            text: The description being narrated (used for comparison)
+            message: The full sentence that would be spoken, for the audio estimate
+        """
+        shingles = self._shingles(text)
+        now = time.time()
+        cutoff = now - self.memory_seconds
+        with self._lock:
+            best = max((self.jaccard(shingles, s) for t, s in self._recent if t >= cutoff), default=0.0)
+            if best >= self.threshold:
+                self.suppressed += 1
+                self.tts_calls_saved += 1
+                self.audio_seconds_saved += len((message or text).split()) * 60.0 / self.words_per_minute
+                return False
+
+            self._recent.append((now, shingles))
+            return True
+
+    def reset(self):
+        with self._lock:
+            self._recent.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'suppressed': self.suppressed,
+                'tts_calls_saved': self.tts_calls_saved,
+                'audio_seconds_saved': round(self.audio_seconds_saved, 1)
+            }
@@ -0,0 +1,116 @@
+import os
+import cv2
+import threading
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+# Class list of the 20-class PASCAL VOC MobileNet-SSD model
+VOC_CLASSES = [
+    "background", "aeroplane", "bicycle", "bird", "boat", "bottle", "bus", "car", "cat",
+    "chair", "cow", "diningtable", "dog", "horse", "motorbike", "person", "pottedplant",
+    "sheep", "sofa", "train", "tvmonitor"
+]
+
+SPOKEN_NAMES = {
+    "aeroplane": ("airplane", "airplanes"),
+    "diningtable": ("table", "tables"),
+    "person": ("person", "people"),
+    "pottedplant": ("potted plant", "potted plants"),
+    "tvmonitor": ("screen", "screens"),
+    "sheep": ("sheep", "sheep"),
+    "bus": ("bus", "buses")
+}
+
+DEFAULT_MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models")
+PROTOTXT_NAME = "MobileNetSSD_deploy.prototxt"
+WEIGHTS_NAME = "MobileNetSSD_deploy.caffemodel"
+
+
+class ObjectDetector:
+    """
+    Small CPU object detector (MobileNet-SSD through OpenCV DNN).
+
+    Gives an object-level summary of the scene in a few tens of milliseconds,
+    so camera questions can be answered before the cloud description arrives.
+    The model files are read from ``modules/models``; without them the
+    detector reports itself unavailable and callers fall back to AI vision.
+    """
+
+    def __init__(self, model_dir: Optional[str] = None, confidence: float = 0.5,
+                 input_size: int = 300):
+        self.model_dir = model_dir or DEFAULT_MODEL_DIR
+        self.confidence = confidence
+        self.input_size = input_size
+        self._net = None
+        self._available: Optional[bool] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_available(self) -> bool:
+        """True once the model files are found and the network loads."""
+        if self._available is None:
+            self._available = False
+            prototxt = os.path.join(self.model_dir, PROTOTXT_NAME)
+            weights = os.path.join(self.model_dir, WEIGHTS_NAME)
+            if not (os.path.exists(prototxt) and os.path.exists(weights)):
+                print(f"DEBUG: Object detector model not found in {self.model_dir}; local detection disabled.")
+                return False
+            try:
+                self._net = cv2.dnn.readNetFromCaffe(prototxt, weights)
+                self._net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+                self._net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+                self._available = True
+            except Exception as e:
+                print(f"DEBUG: Could not load object detector model: {e}")
+        return self._available
+
+    def detect(self, frame: np.ndarray) -> List[Dict[str, Any]]:
+        """Return detections as dictionaries with 'label', 'confidence' and 'box' (x, y, w, h)."""
+        if not self.is_available:
+            return []
+
+        height, width = frame.shape[:2]
+        blob = cv2.dnn.blobFromImage(
+            cv2.resize(frame, (self.input_size, self.input_size), interpolation=cv2.INTER_AREA),
+            0.007843, (self.input_size, self.input_size), 127.5
+        )
+        with self._lock:
+            self._net.setInput(blob)
+            output = self._net.forward()
+
+        detections = []
+        for detection in output[0, 0]:
+            confidence = float(detection[2])
+            class_id = int(detection[1])
+            if confidence < self.confidence or not 0 < class_id < len(VOC_CLASSES):
+                continue
+            x0, y0, x1, y1 = (detection[3:7] * np.array([width, height, width, height])).astype(int)
+            x0, y0 = max(0, x0), max(0, y0)
+            detections.append({
+                'label': VOC_CLASSES[class_id],
+                'confidence': confidence,
+                'box': (int(x0), int(y0), int(min(width, x1) - x0), int(min(height, y1) - y0))
+            })
+        return detections
+
+    @staticmethod
+    def summarize(detections: List[Dict[str, Any]]) -> str:
+        """Turn detections into a short spoken phrase such as '2 people and a chair'."""
+        counts: Dict[str, int] = {}
+        for detection in detections:
+            counts[detection['label']] = counts.get(detection['label'], 0) + 1
+        if not counts:
+            return ""
+
+        parts = []
+        for label, count in sorted(counts.items(), key=lambda item: -item[1]):
+            singular, plural = SPOKEN_NAMES.get(label, (label, label + "s"))
+            if count == 1:
+                article = "an" if singular[0] in "aeiou" else "a"
+                parts.append(f"{article} {singular}")
+            else:
+                parts.append(f"{count} {plural}")
+
+        if len(parts) == 1:
+            return parts[0]
+        return ", ".join(parts[:-1]) + " and " + parts[-1]
@@ -0,0 +1,130 @@
+import cv2
+import time
+from typing import Dict, Any, List, Tuple
+import numpy as np
+
+try:
+    import pytesseract
+    TESSERACT_AVAILABLE = True
+except ImportError:
+    pytesseract = None
+    TESSERACT_AVAILABLE = False
+
+
+class LocalOCR:
+    """
+    CPU text reader used before escalating to the vision model.
+
+    Text-like regions are located with a morphological gradient and a
+    horizontal closing that merges characters into lines. Only those crops are
+    passed to Tesseract, which keeps a pass well under the cost of a cloud
+    round trip.
+    """
+
+    def __init__(self, max_regions: int = 8, detect_width: int = 960,
+                 min_text_height: int = 32, tesseract_config: str = "--psm 6"):
+        self.max_regions = max_regions
+        self.detect_width = detect_width
+        self.min_text_height = min_text_height
+        self.tesseract_config = tesseract_config
+        self._available = None
+
+    @property
+    def is_available(self) -> bool:
+        """True when pytesseract is installed and the Tesseract binary can be found."""
+        if self._available is None:
+            self._available = False
+            if TESSERACT_AVAILABLE:
+                try:
+                    pytesseract.get_tesseract_version()
+                    self._available = True
+                except Exception as e:
+                    print(f"DEBUG: Tesseract not available, local OCR disabled: {e}")
+        return self._available
+
+    def find_text_regions(self, gray: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Return (x, y, w, h) boxes of likely text lines in full-resolution coordinates."""
+        height, width = gray.shape[:2]
+        scale = min(1.0, self.detect_width / float(width))
+        small = gray
+        if scale < 1.0:
+            small = cv2.resize(gray, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+        gradient = cv2.morphologyEx(small, cv2.MORPH_GRADIENT,
+                                    cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+        _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE,
+                                     cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)))
+        contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        inv = 1.0 / scale
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if w < 12 or h < 6 or h > small.shape[0] * 0.5 or w < h * 1.2:
+                continue
+            filled = cv2.countNonZero(connected[y:y + h, x:x + w]) / float(w * h)
+            if filled < 0.35:
+                continue
+            pad = max(2, h // 4)
+            x0, y0 = max(0, int((x - pad) * inv)), max(0, int((y - pad) * inv))
+            x1 = min(width, int((x + w + pad) * inv))
+            y1 = min(height, int((y + h + pad) * inv))
+            boxes.append((x0, y0, x1 - x0, y1 - y0))
+
+        # Largest regions first, read top-to-bottom
+        boxes.sort(key=lambda b: b[2] * b[3], reverse=True)
+        boxes = boxes[:self.max_regions]
+        boxes.sort(key=lambda b: (b[1], b[0]))
+        return boxes
+
+    def _read_region(self, crop: np.ndarray) -> Tuple[List[str], List[float]]:
+        if crop.shape[0] < self.min_text_height:
+            factor = self.min_text_height / float(crop.shape[0])
+            crop = cv2.resize(crop, None, fx=factor, fy=factor, interpolation=cv2.INTER_CUBIC)
+
+        data = pytesseract.image_to_data(crop, config=self.tesseract_config,
+                                         output_type=pytesseract.Output.DICT)
+        words, confidences = [], []
+        for word, conf in zip(data.get('text', []), data.get('conf', [])):
+            word = word.strip()
+            try:
+                conf = float(conf)
+            except (TypeError, ValueError):
+                continue
+            if word and conf >= 0:
+                words.append(word)
+                confidences.append(conf)
+        return words, confidences
+
+    def read(self, frame: np.ndarray) -> Dict[str, Any]:
+        """
+        Read text from a BGR frame.
+
+        Returns a dictionary with the extracted 'text', the mean word
+        'confidence' (0-100, weighted by word length), the 'regions' that were
+        read and the pass 'duration' in seconds.
+        """
+        start = time.perf_counter()
+        result = {'text': "", 'confidence': 0.0, 'regions': [], 'duration': 0.0}
+        if not self.is_available:
+            return result
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        regions = self.find_text_regions(gray)
+
+        lines, weighted, total = [], 0.0, 0
+        for (x, y, w, h) in regions:
+            words, confidences = self._read_region(gray[y:y + h, x:x + w])
+            if not words:
+                continue
+            lines.append(" ".join(words))
+            for word, conf in zip(words, confidences):
+                weighted += conf * len(word)
+                total += len(word)
+
+        result['text'] = " ".join(lines)
+        result['confidence'] = weighted / total if total else 0.0
+        result['regions'] = regions
+        result['duration'] = time.perf_counter() - start
+        return result
@@ -0,0 +1,250 @@
+import os
+import sys
+import time
+import psutil
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import pwd
+except ImportError:
+    pwd = None
+
+ProcessKey = Tuple[int, float]
+
+STATIC_FIELDS = ['name', 'username', 'exe']
+VOLATILE_FIELDS = ['cpu_percent', 'memory_percent', 'status', 'ppid', 'num_threads']
+if sys.platform == 'win32':
+    VOLATILE_FIELDS.append('num_handles')
+
+PROC_STATUS = {
+    'R': 'running', 'S': 'sleeping', 'D': 'disk-sleep', 'Z': 'zombie', 'T': 'stopped',
+    't': 'tracing-stop', 'X': 'dead', 'x': 'dead', 'I': 'idle', 'K': 'wake-kill',
+    'W': 'waking', 'P': 'parked'
+}
+
+# Field positions in /proc/<pid>/stat counted from the state letter after "(comm)"
+STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME, STAT_THREADS, STAT_STARTTIME, STAT_RSS = 0, 1, 11, 12, 17, 19, 21
+
+
+class PsutilBackend:
+    """
+    Portable backend built on psutil.process_iter.
+
+    ``scan()`` yields each live process with its volatile fields, and
+    ``static_info()`` fills in the fields that never change for a process
+    the first time the table sees it.
+    """
+
+    name = 'psutil'
+
+    def __init__(self):
+        self._procs: Dict[ProcessKey, psutil.Process] = {}
+
+    def scan(self) -> Iterator[Tuple[ProcessKey, Dict[str, Any]]]:
+        """Yield ((pid, create_time), volatile fields) for every live process."""
+        procs = self._procs = {}
+        for proc in psutil.process_iter(VOLATILE_FIELDS):
+            try:
+                key = (proc.pid, proc.create_time())
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            procs[key] = proc
+            yield key, proc.info
+
+    def static_info(self, key: ProcessKey) -> Optional[Dict[str, Any]]:
+        proc = self._procs.get(key)
+        if proc is None:
+            return None
+        info = {'pid': proc.pid, 'create_time': key[1]}
+        try:
+            with proc.oneshot():
+                for field in STATIC_FIELDS:
+                    try:
+                        info[field] = getattr(proc, field)()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        info[field] = None
+                try:
+                    info['cmdline'] = ' '.join(proc.cmdline())
+                except (psutil.AccessDenied, psutil.ZombieProcess):
+                    info['cmdline'] = "Access denied"
+        except psutil.NoSuchProcess:
+            return None
+        info['name'] = info['name'] or ""
+        info['created'] = datetime.fromtimestamp(key[1]).strftime("%Y-%m-%d %H:%M:%S")
+        return info
+
+
+class ProcfsBackend:
+    """
+    Reads process data straight from /proc on Linux.
+
+    One pass opens only /proc/<pid>/stat per process, into a reused buffer.
+    That file already carries the state, parent, thread count, start time,
+    CPU ticks and resident pages (the same counter /proc/<pid>/statm
+    reports), so a warm refresh costs one read per process. CPU percentages
+    come from tick deltas between passes. The command line, executable
+    and owner are read only when a process first appears.
+    """
+
+    name = 'procfs'
+
+    def __init__(self, procfs_path: str = "/proc", buffer_size: int = 4096):
+        self.procfs_path = procfs_path
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.boot_time = self._read_boot_time()
+        self.mem_total = self._read_mem_total()
+        self._buffer = bytearray(buffer_size)
+        self._prev_ticks: Dict[ProcessKey, Tuple[int, float]] = {}
+        self._users: Dict[int, Optional[str]] = {}
+        self._stat_cache: Dict[ProcessKey, Tuple[bytes, int]] = {}
+
+    @staticmethod
+    def is_supported(procfs_path: str = "/proc") -> bool:
+        return (sys.platform.startswith('linux') and pwd is not None and hasattr(os, 'readv')
+                and os.path.exists(os.path.join(procfs_path, "stat")))
+
+    def _read_boot_time(self) -> float:
+        with open(os.path.join(self.procfs_path, "stat"), 'rb') as f:
+            for line in f:
+                if line.startswith(b"btime"):
+                    return float(line.split()[1])
+        raise RuntimeError("btime missing from /proc/stat")
+
+    def _read_mem_total(self) -> int:
+        with open(os.path.join(self.procfs_path, "meminfo"), 'rb') as f:
+            for line in f:
+                if line.startswith(b"MemTotal:"):
+                    return int(line.split()[1]) * 1024
+        raise RuntimeError("MemTotal missing from /proc/meminfo")
+
+    def _read(self, path: str) -> Optional[bytes]:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            length = os.readv(fd, [self._buffer])
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+        return bytes(self._buffer[:length])
+
+    def _read_all(self, path: str) -> Optional[bytes]:
+        """Read a file of any length; the shared buffer would cut off long command lines."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        chunks = []
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+        return b"".join(chunks)
+
+    def scan(self) -> Iterator[Tuple[ProcessKey, Dict[str, Any]]]:
+        """Yield ((pid, create_time), volatile fields) for every live process."""
+        now = time.time()
+        prev_ticks = self._prev_ticks
+        ticks_now: Dict[ProcessKey, Tuple[int, float]] = {}
+        # Filled as the scan goes so static_info() can be called for each new key
+        stat_cache = self._stat_cache = {}
+        mem_scale = self.page_size * 100.0 / self.mem_total
+        clock_ticks = float(self.clock_ticks)
+
+        for entry in os.scandir(self.procfs_path):
+            if not entry.name.isdigit():
+                continue
+            data = self._read(entry.path + "/stat")
+            if not data:
+                continue
+            close = data.rfind(b")")
+            fields = data[close + 2:].split()
+            pid = int(entry.name)
+            key = (pid, round(self.boot_time + int(fields[STAT_STARTTIME]) / clock_ticks, 2))
+
+            ticks = int(fields[STAT_UTIME]) + int(fields[STAT_STIME])
+            previous = prev_ticks.get(key)
+            if previous is not None and now > previous[1]:
+                cpu_percent = (ticks - previous[0]) / clock_ticks / (now - previous[1]) * 100.0
+            else:
+                cpu_percent = 0.0
+            ticks_now[key] = (ticks, now)
+            stat_cache[key] = (data[data.find(b"(") + 1:close], pid)
+
+            yield key, {
+                'cpu_percent': round(cpu_percent, 1),
+                'memory_percent': int(fields[STAT_RSS]) * mem_scale,
+                'status': PROC_STATUS.get(fields[STAT_STATE].decode(), fields[STAT_STATE].decode()),
+                'ppid': int(fields[STAT_PPID]),
+                'num_threads': int(fields[STAT_THREADS])
+            }
+
+        self._prev_ticks = ticks_now
+
+    def _username(self, uid: int) -> Optional[str]:
+        if uid not in self._users:
+            try:
+                self._users[uid] = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                self._users[uid] = str(uid)
+        return self._users[uid]
+
+    def static_info(self, key: ProcessKey) -> Optional[Dict[str, Any]]:
+        """Fields that never change for a process, read once when it appears."""
+        cached = self._stat_cache.get(key)
+        if cached is None:
+            return None
+        comm, pid = cached
+        base = f"{self.procfs_path}/{pid}"
+
+        cmdline_raw = self._read_all(base + "/cmdline")
+        args = [a.decode(errors='replace') for a in (cmdline_raw or b"").split(b"\0") if a]
+        name = comm.decode(errors='replace')
+        # comm is cut at 15 characters; the command line has the full name
+        if len(name) >= 15 and args:
+            full = os.path.basename(args[0])
+            if full.startswith(name):
+                name = full
+
+        try:
+            exe = os.readlink(base + "/exe")
+        except OSError:
+            exe = None
+        try:
+            username = self._username(os.stat(base).st_uid)
+        except OSError:
+            username = None
+
+        return {
+            'pid': pid,
+            'create_time': key[1],
+            'name': name,
+            'username': username,
+            'exe': exe,
+            # Kernel threads have an empty command line; only a failed read means no access
+            'cmdline': ' '.join(args) if cmdline_raw is not None else "Access denied",
+            'created': datetime.fromtimestamp(key[1]).strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+
+def create_backend(name: Optional[str] = None):
+    """
+    Return the process backend to use: 'procfs', 'psutil', or the fastest
+    one available when name is None.
+    """
+    if name in (None, 'procfs') and ProcfsBackend.is_supported():
+        try:
+            return ProcfsBackend()
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"DEBUG: /proc backend unavailable, using psutil: {str(e)}")
+    return PsutilBackend()
@@ -0,0 +1,170 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+METRICS = ('cpu', 'memory')
+# Spread below which differences are not interesting, in percentage points
+METRIC_FLOORS = np.array([2.0, 0.5])
+# Minimum current value before a process can be reported at all
+METRIC_MINIMUMS = np.array([5.0, 1.0])
+
+
+class ProcessAnomalyDetector:
+    """
+    Flags processes whose resource use is unusual, with the evidence for it.
+
+    For every process an exponentially weighted mean and variance of CPU and
+    memory is kept, and the same is done per executable name so a freshly
+    started process can be compared with earlier runs of the same program.
+    Each update scores the current sample twice: against the process's own
+    (or its executable's) baseline, and against the host baseline, which is
+    the median and MAD across all processes in the same sample. A process
+    counts as an outlier only when it stands out on both.
+
+    Memory stays bounded: per-process state is rebuilt from the live process
+    set on every update, and executable baselines are kept in an LRU map of
+    at most ``max_executables`` entries.
+    """
+
+    def __init__(self, alpha: float = 0.1, min_samples: int = 5, max_executables: int = 2048,
+                 keep_top: int = 50):
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.max_executables = max_executables
+        self.keep_top = keep_top
+        self.updates: int = 0
+        self.last_update_cost: Optional[float] = None
+        self._rows: Dict[tuple, int] = {}
+        self._n = np.zeros(0)
+        self._mean = np.zeros((0, len(METRICS)))
+        self._var = np.zeros((0, len(METRICS)))
+        self._executables: "OrderedDict[str, List[np.ndarray]]" = OrderedDict()
+        self._scores: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_warm(self) -> bool:
+        return self.updates >= self.min_samples
+
+    def _ewma(self, mean: np.ndarray, var: np.ndarray, x: np.ndarray, first: np.ndarray):
+        delta = x - mean
+        mean = mean + self.alpha * delta
+        var = (1 - self.alpha) * (var + self.alpha * delta * delta)
+        mean[first] = x[first]
+        var[first] = 0.0
+        return mean, var
+
+    def update(self, snapshot):
+        """Score and then learn from one ProcessSnapshot."""
+        start = time.perf_counter()
+        count = len(snapshot)
+        keys = list(zip(snapshot.pid.tolist(), snapshot.create_time.tolist()))
+        x = np.column_stack([snapshot.cpu, snapshot.memory]).astype(np.float64)
+
+        with self._lock:
+            old_rows = np.fromiter((self._rows.get(key, -1) for key in keys), dtype=np.int64, count=count)
+            known = old_rows >= 0
+            n = np.zeros(count)
+            mean = np.zeros((count, len(METRICS)))
+            var = np.zeros((count, len(METRICS)))
+            n[known] = self._n[old_rows[known]]
+            mean[known] = self._mean[old_rows[known]]
+            var[known] = self._var[old_rows[known]]
+
+            # Executable baselines: one sample per name, the mean over its processes
+            name_count = np.bincount(snapshot.name_index, minlength=len(snapshot.names)).astype(np.float64)
+            name_mean = np.column_stack([
+                np.bincount(snapshot.name_index, weights=x[:, m], minlength=len(snapshot.names))
+                for m in range(len(METRICS))
+            ]) / np.maximum(name_count, 1)[:, None]
+            exe_n = np.zeros(len(snapshot.names))
+            exe_mean = np.zeros((len(snapshot.names), len(METRICS)))
+            exe_var = np.zeros((len(snapshot.names), len(METRICS)))
+            for i, name in enumerate(snapshot.names):
+                state = self._executables.get(name)
+                if state is not None:
+                    exe_n[i], exe_mean[i], exe_var[i] = state
+
+            self._scores = self._score(snapshot, keys, x, n, mean, var,
+                                       exe_n[snapshot.name_index], exe_mean[snapshot.name_index],
+                                       exe_var[snapshot.name_index])
+
+            # Learn from this sample
+            mean, var = self._ewma(mean, var, x, n == 0)
+            self._n, self._mean, self._var = n + 1, mean, var
+            self._rows = dict(zip(keys, range(count)))
+
+            exe_mean, exe_var = self._ewma(exe_mean, exe_var, name_mean, exe_n == 0)
+            for i, name in enumerate(snapshot.names):
+                if name_count[i]:
+                    self._executables[name] = [exe_n[i] + 1, exe_mean[i], exe_var[i]]
+                    self._executables.move_to_end(name)
+            while len(self._executables) > self.max_executables:
+                self._executables.popitem(last=False)
+
+            self.updates += 1
+            self.last_update_cost = time.perf_counter() - start
+
+    def _score(self, snapshot, keys, x, n, mean, var, exe_n, exe_mean, exe_var) -> List[Dict[str, Any]]:
+        if not len(keys):
+            return []
+
+        host_median = np.median(x, axis=0)
+        host_mad = np.median(np.abs(x - host_median), axis=0) * 1.4826
+        z_host = (x - host_median) / (host_mad + METRIC_FLOORS)
+
+        own_warm = n >= self.min_samples
+        exe_warm = exe_n >= self.min_samples
+        z_own = (x - mean) / (np.sqrt(var) + METRIC_FLOORS)
+        z_exe = (x - exe_mean) / (np.sqrt(exe_var) + METRIC_FLOORS)
+        # A process is judged on its own history once it has one, else on its executable's
+        z_base = np.where(own_warm[:, None], z_own, np.where(exe_warm[:, None], z_exe, np.nan))
+
+        # Must stand out against both baselines. With no baseline yet the host score counts half,
+        # and only once the detector is warm: right after startup the host MAD is near zero
+        host_only = z_host * 0.5 if self.is_warm else np.zeros_like(z_host)
+        score = np.where(np.isnan(z_base), host_only, np.minimum(z_base, z_host))
+        score[x < METRIC_MINIMUMS] = 0.0
+        best_metric = np.argmax(score, axis=1)
+        best = score[np.arange(len(keys)), best_metric]
+
+        candidates = np.flatnonzero(best >= 1.0)
+        if len(candidates) > self.keep_top:
+            candidates = candidates[np.argpartition(-best[candidates], self.keep_top - 1)[:self.keep_top]]
+
+        results = []
+        for row in candidates:
+            m = best_metric[row]
+            results.append({
+                'pid': keys[row][0],
+                'name': snapshot.name(row),
+                'metric': METRICS[m],
+                'value': float(x[row, m]),
+                'score': float(best[row]),
+                'own_mean': float(mean[row, m]) if own_warm[row] else None,
+                'own_std': float(np.sqrt(var[row, m])) if own_warm[row] else None,
+                'exe_mean': float(exe_mean[row, m]) if exe_warm[row] else None,
+                'host_median': float(host_median[m]),
+                'z_own': float(z_own[row, m]) if own_warm[row] else None,
+                'z_exe': float(z_exe[row, m]) if exe_warm[row] else None,
+                'z_host': float(z_host[row, m]),
+                'samples': int(n[row])
+            })
+        results.sort(key=lambda r: r['score'], reverse=True)
+        return results
+
+    def top_outliers(self, limit: int = 5, min_score: float = 3.0) -> List[Dict[str, Any]]:
+        """Return up to limit outliers from the latest update, highest score first, with their evidence."""
+        with self._lock:
+            return [dict(r) for r in self._scores if r['score'] >= min_score][:limit]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'updates': self.updates,
+                'processes': len(self._rows),
+                'executables': len(self._executables),
+                'last_update_ms': round(self.last_update_cost * 1000, 2) if self.last_update_cost is not None else None
+            }
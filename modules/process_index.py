@@ -0,0 +1,126 @@
+import os
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+class ProcessNameIndex:
+    """
+    Incremental index for case-insensitive process name lookups.
+
+    Each distinct lowercase name is broken into character n-grams; a
+    substring query intersects the posting sets of its own n-grams and only
+    checks the few names that survive. Executable base names (``chrome.exe``,
+    ``python3``) are also kept in an exact-match map. When nothing contains
+    the query, a fuzzy search can fall back to the names most similar to it
+    by n-gram overlap, for misheard or misspelt names ("spotfy"). Processes
+    are added and removed one at a time as the process table changes.
+    """
+
+    def __init__(self, n: int = 3, min_similarity: float = 0.4):
+        self.n = n
+        self.min_similarity = min_similarity
+        self._keys_by_name: Dict[str, Set[Hashable]] = {}
+        self._names_by_gram: Dict[str, Set[str]] = {}
+        self._keys_by_exe: Dict[str, Set[Hashable]] = {}
+
+    def _grams(self, text: str) -> Set[str]:
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    @staticmethod
+    def _exe_name(exe: Optional[str]) -> str:
+        return os.path.basename(exe).lower() if exe else ""
+
+    def add(self, key: Hashable, name: str, exe: Optional[str] = None):
+        name = (name or "").lower()
+        keys = self._keys_by_name.get(name)
+        if keys is None:
+            keys = self._keys_by_name[name] = set()
+            for gram in self._grams(name):
+                self._names_by_gram.setdefault(gram, set()).add(name)
+        keys.add(key)
+
+        exe_name = self._exe_name(exe)
+        if exe_name:
+            self._keys_by_exe.setdefault(exe_name, set()).add(key)
+
+    def remove(self, key: Hashable, name: str, exe: Optional[str] = None):
+        name = (name or "").lower()
+        keys = self._keys_by_name.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                # Last process with this name; drop it from the n-gram postings too
+                del self._keys_by_name[name]
+                for gram in self._grams(name):
+                    names = self._names_by_gram.get(gram)
+                    if names is not None:
+                        names.discard(name)
+                        if not names:
+                            del self._names_by_gram[gram]
+
+        exe_name = self._exe_name(exe)
+        keys = self._keys_by_exe.get(exe_name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_exe[exe_name]
+
+    def find_exe(self, exe_name: str) -> Set[Hashable]:
+        """Keys of processes whose executable base name is exactly exe_name."""
+        return set(self._keys_by_exe.get(exe_name.lower(), ()))
+
+    def similar_names(self, query: str) -> List[Tuple[str, float]]:
+        """
+        Names sharing an n-gram with query, most similar first, as (name, similarity).
+
+        Similarity is the Jaccard overlap of n-grams padded with spaces, so
+        the start and end of a word count, and ignores a trailing ".exe".
+        Names below min_similarity are left out.
+        """
+        query = query.lower()
+        padded = self._padded_grams(query)
+        candidates: Set[str] = set()
+        for gram in self._grams(query):
+            candidates |= self._names_by_gram.get(gram, set())
+
+        ranked = []
+        for name in candidates:
+            grams = self._padded_grams(name[:-4] if name.endswith(".exe") else name)
+            similarity = len(padded & grams) / len(padded | grams)
+            if similarity >= self.min_similarity:
+                ranked.append((name, similarity))
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+    def _padded_grams(self, text: str) -> Set[str]:
+        return self._grams(" " * (self.n - 1) + text + " ")
+
+    def search(self, query: str, fuzzy: bool = False) -> Set[Hashable]:
+        """
+        Keys of processes whose name contains query, or whose executable is named query.
+
+        With fuzzy, a query nothing contains matches the most similar name
+        instead (all of them on a tie); see similar_names.
+        """
+        query = query.lower()
+        if len(query) < self.n:
+            names = [name for name in self._keys_by_name if query in name]
+        else:
+            postings = [self._names_by_gram.get(gram) for gram in self._grams(query)]
+            if any(p is None for p in postings):
+                names = []
+            else:
+                postings.sort(key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+                names = [name for name in candidates if query in name]
+
+        keys = self.find_exe(query)
+        if not names and not keys and fuzzy:
+            ranked = self.similar_names(query)
+            names = [name for name, similarity in ranked if similarity == ranked[0][1]]
+        for name in names:
+            keys |= self._keys_by_name[name]
+        return keys
+
+    def get_stats(self):
+        return {'names': len(self._keys_by_name), 'grams': len(self._names_by_gram),
+                'executables': len(self._keys_by_exe)}
@@ -0,0 +1,90 @@
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+class ProcessReport:
+    """
+    One captured view of the process list, ready to be rendered several ways.
+
+    The top processes, the total count and the system CPU/memory figures are
+    read once when the report is made, so the spoken summary, the printed
+    table and a JSON export of the same query all describe the same moment.
+    """
+
+    def __init__(self, processes: List[Dict[str, Any]], total: int, sort_by: str,
+                 cpu_percent: float, memory_percent: float):
+        self.processes = [dict(p) for p in processes]
+        self.total = total
+        self.sort_by = sort_by
+        self.cpu_percent = cpu_percent
+        self.memory_percent = memory_percent
+        self.captured_at = time.time()
+
+    def render(self, detail_level: str = 'normal') -> str:
+        """Render as 'spoken', 'minimal', 'normal', 'detailed' or 'json'."""
+        renderers = {
+            'spoken': self.render_spoken,
+            'minimal': self.render_minimal,
+            'normal': self.render_normal,
+            'detailed': self.render_detailed,
+            'json': self.render_json
+        }
+        return renderers.get(detail_level, self.render_normal)()
+
+    def _empty(self) -> str:
+        return "No processes found or unable to access process information."
+
+    def _system_line(self) -> str:
+        return f"\nOverall system usage: CPU {self.cpu_percent}%, Memory {self.memory_percent}% used."
+
+    def render_spoken(self) -> str:
+        if not self.processes:
+            return self._empty()
+        top = self.processes[0]
+        return (f"Currently running {self.total} processes. Top process by {self.sort_by}: "
+                f"{top.get('name', 'Unknown')} using {top.get('cpu_percent', 0):.1f}% CPU.")
+
+    def render_minimal(self) -> str:
+        if not self.processes:
+            return self._empty()
+        description = f"Top {len(self.processes)} running processes: "
+        description += ", ".join(f"{p.get('name', 'Unknown')} (PID: {p.get('pid', 'N/A')})" for p in self.processes)
+        return description + self._system_line()
+
+    def render_normal(self) -> str:
+        if not self.processes:
+            return self._empty()
+        description = f"Currently running {self.total} processes. Top {len(self.processes)} by {self.sort_by}:\n"
+        for p in self.processes:
+            description += f"- {p.get('name', 'Unknown')} (PID: {p.get('pid', 'N/A')}): "
+            description += f"CPU {p.get('cpu_percent', 0):.1f}%, Mem {p.get('memory_percent', 0):.1f}%, "
+            description += f"Status: {p.get('status', 'Unknown')}\n"
+        return description + self._system_line()
+
+    def render_detailed(self) -> str:
+        if not self.processes:
+            return self._empty()
+        description = f"System running {self.total} total processes. Top {len(self.processes)} by {self.sort_by}:\n\n"
+        for p in self.processes:
+            description += f"- {p.get('name', 'Unknown')} (PID: {p.get('pid', 'N/A')})\n"
+            description += f"  CPU: {p.get('cpu_percent', 0):.1f}%, Memory: {p.get('memory_percent', 0):.1f}%\n"
+            description += f"  User: {p.get('username', 'Unknown')}, Status: {p.get('status', 'Unknown')}\n"
+            description += f"  Started: {p.get('created', 'Unknown')}\n"
+            if p.get('cmdline'):
+                description += f"  Command: {p.get('cmdline')[:60]}{'...' if len(p.get('cmdline', '')) > 60 else ''}\n"
+            description += "\n"
+        return description + self._system_line()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'captured_at': datetime.fromtimestamp(self.captured_at).strftime("%Y-%m-%d %H:%M:%S"),
+            'total_processes': self.total,
+            'sort_by': self.sort_by,
+            'system': {'cpu_percent': self.cpu_percent, 'memory_percent': self.memory_percent},
+            'processes': self.processes
+        }
+
+    def render_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, default=str)
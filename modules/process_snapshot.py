@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+SORT_COLUMNS = {
+    'cpu_percent': 'cpu',
+    'memory_percent': 'memory',
+    'created': 'create_time',
+    'cpu': 'cpu',
+    'memory': 'memory',
+    'create_time': 'create_time'
+}
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class ProcessSnapshot:
+    """
+    Immutable, column-oriented view of the process table at one moment.
+
+    PIDs, CPU, memory, start times and an index into a shared name list are
+    held in numpy arrays, so ranking and filtering are vectorised and never
+    reorder the process cache itself. Full records are only materialised for
+    the rows a caller actually asks for.
+    """
+
+    def __init__(self, pid: np.ndarray, cpu: np.ndarray, memory: np.ndarray, create_time: np.ndarray,
+                 name_index: np.ndarray, names: Sequence[str], records: Sequence[Dict[str, Any]]):
+        self.pid = _frozen(pid)
+        self.cpu = _frozen(cpu)
+        self.memory = _frozen(memory)
+        self.create_time = _frozen(create_time)
+        self.name_index = _frozen(name_index)
+        self.names = tuple(names)
+        self._records = tuple(records)
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Dict[str, Any]]) -> "ProcessSnapshot":
+        count = len(entries)
+        names: Dict[str, int] = {}
+
+        def column(field, dtype, default=0.0):
+            return np.fromiter((entry.get(field) or default for entry in entries), dtype=dtype, count=count)
+
+        pid = column('pid', np.int64, -1)
+        cpu = column('cpu_percent', np.float32)
+        memory = column('memory_percent', np.float32)
+        create_time = column('create_time', np.float64)
+        name_index = np.fromiter((names.setdefault(entry.get('name') or "", len(names)) for entry in entries),
+                                 dtype=np.int32, count=count)
+
+        return cls(pid, cpu, memory, create_time, name_index, list(names), entries)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def column(self, sort_by: str) -> np.ndarray:
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Unsupported process sort field: {sort_by}")
+        return getattr(self, SORT_COLUMNS[sort_by])
+
+    def top_k(self, k: int, sort_by: str = 'cpu_percent', rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return the row indices of the k largest values, largest first."""
+        values = self.column(sort_by)
+        if rows is not None:
+            values = values[rows]
+        k = min(k, len(values))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k < len(values):
+            candidates = np.argpartition(-values, k - 1)[:k]
+        else:
+            candidates = np.arange(len(values))
+        ordered = candidates[np.argsort(-values[candidates], kind='stable')]
+        return rows[ordered] if rows is not None else ordered
+
+    def mask(self, min_cpu: Optional[float] = None, min_memory: Optional[float] = None,
+             name: Optional[str] = None) -> np.ndarray:
+        """Boolean row mask for the given thresholds and case-insensitive name substring."""
+        selected = np.ones(len(self), dtype=bool)
+        if min_cpu is not None:
+            selected &= self.cpu > min_cpu
+        if min_memory is not None:
+            selected &= self.memory > min_memory
+        if name:
+            name = name.lower()
+            matching = np.fromiter((name in n.lower() for n in self.names), dtype=bool, count=len(self.names))
+            selected &= matching[self.name_index]
+        return selected
+
+    def rows(self, **filters) -> np.ndarray:
+        """Indices of the rows matching ``mask(**filters)``."""
+        return np.flatnonzero(self.mask(**filters))
+
+    def name(self, row: int) -> str:
+        return self.names[self.name_index[row]]
+
+    def records(self, rows: Sequence[int]) -> List[Dict[str, Any]]:
+        """Materialise the full process dictionaries for the given rows."""
+        return [self._records[row] for row in rows]
+
+    def total(self, column: str, rows: Optional[np.ndarray] = None) -> float:
+        values = self.column(column)
+        return float(values[rows].sum() if rows is not None else values.sum())
@@ -0,0 +1,161 @@
+import time
+import threading
+from typing import Any, Dict, List, Optional
+from .process_index import ProcessNameIndex
+from .process_tree import ProcessTree
+from .proc_backend import ProcessKey, create_backend
+
+
+class ProcessTable:
+    """
+    Incrementally maintained table of running processes.
+
+    Entries are keyed by (pid, create_time), so a recycled PID shows up as a
+    new process rather than inheriting the old one's data. Fields that never
+    change for a process (name, user, executable, command line, start time)
+    are fetched once when it first appears; each refresh only reads the
+    volatile CPU, memory and status figures and drops processes that exited.
+
+    A ProcessTree over the same entries groups processes into application
+    families and is updated with only the processes that came, went or
+    changed.
+
+    The data comes from a backend (see ``proc_backend``): on Linux the
+    table reads /proc directly, elsewhere it uses psutil.
+
+    Refreshes may run on a background thread; readers get copies through
+    ``snapshot()``.
+    """
+
+    def __init__(self, min_interval: float = 0.5, backend=None):
+        self.backend = backend if backend is not None else create_backend()
+        # psutil CPU figures over very short intervals are mostly noise
+        self.min_interval = min_interval
+        self.last_refresh: float = 0
+        self.entries: Dict[ProcessKey, Dict[str, Any]] = {}
+        self._keys_by_pid: Dict[int, ProcessKey] = {}
+        self.name_index = ProcessNameIndex()
+        self.tree = ProcessTree(self.entries)
+        self._lock = threading.Lock()
+        self.refresh_stats: Dict[str, Any] = {
+            'refreshes': 0,
+            'duration': None,
+            'processes': 0,
+            'added': 0,
+            'changed': 0,
+            'removed': 0
+        }
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        """Bring the table up to date and return a snapshot of its entries."""
+        with self._lock:
+            if time.time() - self.last_refresh >= self.min_interval:
+                self._refresh()
+                self.last_refresh = time.time()
+        return self.snapshot()
+
+    def _refresh(self):
+        start = time.perf_counter()
+        seen = set()
+        added = []
+        changed = []
+
+        for key, volatile in self.backend.scan():
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.backend.static_info(key)
+                if entry is None:
+                    continue
+                self.entries[key] = entry
+                self.name_index.add(key, entry['name'], entry.get('exe'))
+                added.append(key)
+            else:
+                for field, value in volatile.items():
+                    if entry.get(field) != value:
+                        changed.append(key)
+                        break
+            entry.update(volatile)
+            seen.add(key)
+
+        gone = [key for key in self.entries if key not in seen]
+        for key in gone:
+            entry = self.entries.pop(key)
+            self.name_index.remove(key, entry['name'], entry.get('exe'))
+        if added or gone:
+            self._keys_by_pid = {key[0]: key for key in self.entries}
+        self.tree.update(added, changed, gone, self._keys_by_pid)
+
+        stats = self.refresh_stats
+        stats['refreshes'] += 1
+        stats['duration'] = time.perf_counter() - start
+        stats['processes'] = len(self.entries)
+        stats['added'] = len(added)
+        stats['changed'] = len(changed)
+        stats['removed'] = len(gone)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.entries
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return copies of all entries as of the last refresh."""
+        with self._lock:
+            return [dict(entry) for entry in self.entries.values()]
+
+    def find_by_name(self, name: str, fuzzy: bool = False) -> List[Dict[str, Any]]:
+        """
+        Copies of the entries whose name contains name (case-insensitive) or whose executable is named name.
+
+        With fuzzy, the closest names are used when nothing matches exactly.
+        """
+        with self._lock:
+            keys = self.name_index.search(name, fuzzy)
+            return [dict(self.entries[key]) for key in keys if key in self.entries]
+
+    def get_family_usage(self, name: str, include_subtree: bool = False,
+                         fuzzy: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Combined usage of the application families whose processes match name.
+
+        With include_subtree, everything the matching families started is
+        counted too; with fuzzy, the closest names are used when nothing
+        matches exactly. Returns None when nothing matches.
+        """
+        with self._lock:
+            roots = self.tree.families_for(self.name_index.search(name, fuzzy), include_subtree)
+            if not roots:
+                return None
+            families = [self.tree.totals(root, include_subtree) for root in roots]
+        usage = {'families': len(families), 'processes': 0, 'cpu_percent': 0.0, 'memory_percent': 0.0,
+                 'threads': 0, 'handles': None}
+        for family in families:
+            for field in ('processes', 'cpu_percent', 'memory_percent', 'threads'):
+                usage[field] += family[field]
+            if family['handles'] is not None:
+                usage['handles'] = (usage['handles'] or 0) + family['handles']
+        usage['roots'] = sorted(families, key=lambda f: f['cpu_percent'], reverse=True)
+        return usage
+
+    def get_families(self, limit: int = 10, sort_by: str = 'cpu_percent',
+                     include_subtree: bool = False) -> List[Dict[str, Any]]:
+        """The largest application families by sort_by (cpu_percent, memory_percent, threads or processes)."""
+        with self._lock:
+            families = [self.tree.totals(root, include_subtree) for root in list(self.tree.members)]
+        families.sort(key=lambda f: f[sort_by] or 0, reverse=True)
+        return families[:limit]
+
+    def get(self, pid: int) -> Optional[Dict[str, Any]]:
+        """Return the entry for a PID, if the process is in the table."""
+        with self._lock:
+            key = self._keys_by_pid.get(pid)
+            entry = self.entries.get(key) if key is not None else None
+            return dict(entry) if entry is not None else None
+
+    def get_refresh_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.refresh_stats)
+            stats['tree'] = self.tree.get_stats()
+        stats['backend'] = self.backend.name
+        if stats['duration'] is not None:
+            stats['duration_ms'] = round(stats['duration'] * 1000, 2)
+        return stats
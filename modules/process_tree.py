@@ -0,0 +1,214 @@
+import os
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+AGGREGATE_FIELDS = (('cpu_percent', 'cpu_percent'), ('memory_percent', 'memory_percent'),
+                    ('num_threads', 'threads'), ('num_handles', 'handles'))
+
+
+class ProcessTree:
+    """
+    Parent/child tree of the process table, grouped into application families.
+
+    A family is a run of processes with the same executable where each one
+    is a child of another: a browser or editor and the helper processes it
+    spawned of itself. Its root is the topmost process of the run. Each
+    family can be totalled on its own or together with everything started
+    beneath it (its subtree).
+
+    The tree is updated with just the processes that were added, removed or
+    changed since the last refresh. Those mark their family, and the
+    subtrees above it, as dirty; totals are cached and only dirty families
+    are summed again, when they are next asked for.
+    """
+
+    def __init__(self, entries: Dict[Hashable, Dict[str, Any]]):
+        # The process table's own entry dictionaries, updated in place
+        self.entries = entries
+        self.parent: Dict[Hashable, Optional[Hashable]] = {}
+        self.children: Dict[Hashable, Set[Hashable]] = {}
+        self.family_of: Dict[Hashable, Hashable] = {}
+        self.members: Dict[Hashable, Set[Hashable]] = {}
+        self._ppid: Dict[Hashable, Optional[int]] = {}
+        self._own: Dict[Hashable, Dict[str, Any]] = {}
+        self._subtree: Dict[Hashable, Dict[str, Any]] = {}
+        self._dirty_own: Set[Hashable] = set()
+        self._dirty_subtree: Set[Hashable] = set()
+        self.recomputed: int = 0
+
+    @staticmethod
+    def family_name(entry: Dict[str, Any]) -> str:
+        exe = entry.get('exe')
+        return os.path.basename(exe).lower() if exe else (entry.get('name') or "").lower()
+
+    def _mark(self, root: Optional[Hashable]):
+        """Invalidate a family's totals and the subtree totals of every family above it."""
+        if root is None:
+            return
+        self._dirty_own.add(root)
+        # Walk all the way up: a family that was already dirty may have moved under new ancestors
+        while root is not None:
+            self._dirty_subtree.add(root)
+            parent = self.parent.get(root)
+            root = self.family_of.get(parent) if parent is not None else None
+
+    def update(self, added: Iterable[Hashable], changed: Iterable[Hashable], removed: Iterable[Hashable],
+               keys_by_pid: Dict[int, Hashable]):
+        """Apply one refresh: new processes, processes whose figures changed, and processes that exited."""
+        relink = list(added)
+        reassign: List[Hashable] = []
+
+        for key in removed:
+            self._mark(self.family_of.get(key))
+            reassign.extend(self._remove(key))
+
+        for key in changed:
+            if self.entries[key].get('ppid') != self._ppid.get(key):
+                relink.append(key)
+            else:
+                self._mark(self.family_of.get(key))
+
+        # Parents start before their children, so this assigns them first
+        relink.sort(key=lambda k: (k[1], k[0]))
+        for key in relink:
+            self._link(key, keys_by_pid)
+        for key in relink + reassign:
+            if key in self.entries:
+                self._assign(key)
+
+    def _remove(self, key: Hashable) -> List[Hashable]:
+        parent = self.parent.pop(key, None)
+        if parent is not None and parent in self.children:
+            self.children[parent].discard(key)
+        self._ppid.pop(key, None)
+
+        # Orphans stay until the next scan shows who adopted them
+        orphans = list(self.children.pop(key, ()))
+        for child in orphans:
+            self.parent[child] = None
+
+        root = self.family_of.pop(key, None)
+        if root is not None:
+            members = self.members.get(root)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self.members[root]
+        if root == key:
+            self._drop_cache(key)
+        return orphans
+
+    def _drop_cache(self, root: Hashable):
+        self._own.pop(root, None)
+        self._subtree.pop(root, None)
+        self._dirty_own.discard(root)
+        self._dirty_subtree.discard(root)
+
+    def _link(self, key: Hashable, keys_by_pid: Dict[int, Hashable]):
+        entry = self.entries[key]
+        ppid = entry.get('ppid')
+        parent = keys_by_pid.get(ppid) if ppid else None
+        # A parent must have started first, or its PID was recycled
+        if parent == key or (parent is not None and parent[1] > key[1]):
+            parent = None
+
+        old_parent = self.parent.get(key)
+        if old_parent is not None and old_parent in self.children:
+            self.children[old_parent].discard(key)
+            self._mark(self.family_of.get(old_parent))
+        self.parent[key] = parent
+        self._ppid[key] = ppid
+        if parent is not None:
+            self.children.setdefault(parent, set()).add(key)
+
+    def _assign(self, start: Hashable):
+        """Recompute the family of start and, where it changed, of everything below it."""
+        stack = [start]
+        while stack:
+            key = stack.pop()
+            parent = self.parent.get(key)
+            if parent is not None and self.family_name(self.entries[parent]) == self.family_name(self.entries[key]):
+                root = self.family_of.get(parent, key)
+            else:
+                root = key
+
+            old_root = self.family_of.get(key)
+            if old_root == root and key != start:
+                continue
+            if old_root is not None and old_root != root:
+                self._mark(old_root)
+                members = self.members.get(old_root)
+                if members is not None:
+                    members.discard(key)
+                    if not members:
+                        del self.members[old_root]
+                        self._drop_cache(old_root)
+            self.family_of[key] = root
+            self.members.setdefault(root, set()).add(key)
+            self._mark(root)
+            stack.extend(self.children.get(key, ()))
+
+    def _own_totals(self, root: Hashable) -> Dict[str, Any]:
+        if root in self._dirty_own or root not in self._own:
+            totals: Dict[str, Any] = {'processes': 0}
+            for _, label in AGGREGATE_FIELDS:
+                totals[label] = 0
+            has_handles = False
+            for key in self.members.get(root, ()):
+                entry = self.entries[key]
+                totals['processes'] += 1
+                for field, label in AGGREGATE_FIELDS:
+                    value = entry.get(field)
+                    if value is not None:
+                        totals[label] += value
+                        has_handles = has_handles or field == 'num_handles'
+            if not has_handles:
+                # Not every platform reports handle counts cheaply
+                totals['handles'] = None
+            self._own[root] = totals
+            self._dirty_own.discard(root)
+            self.recomputed += 1
+        return self._own[root]
+
+    def _child_families(self, root: Hashable) -> Set[Hashable]:
+        return {self.family_of[child] for key in self.members.get(root, ())
+                for child in self.children.get(key, ()) if self.family_of.get(child, root) != root}
+
+    def _subtree_totals(self, root: Hashable) -> Dict[str, Any]:
+        if root in self._dirty_subtree or root not in self._subtree:
+            totals = dict(self._own_totals(root))
+            for child_root in self._child_families(root):
+                child = self._subtree_totals(child_root)
+                for _, label in AGGREGATE_FIELDS:
+                    if child[label] is not None:
+                        totals[label] = (totals[label] or 0) + child[label]
+                totals['processes'] += child['processes']
+            self._subtree[root] = totals
+            self._dirty_subtree.discard(root)
+        return self._subtree[root]
+
+    def families_for(self, keys: Iterable[Hashable], include_subtree: bool = False) -> Set[Hashable]:
+        """Family roots of the given processes, without roots nested under another one when include_subtree."""
+        roots = {self.family_of[key] for key in keys if key in self.family_of}
+        if not include_subtree:
+            return roots
+        nested = set()
+        for root in roots:
+            parent = self.parent.get(root)
+            while parent is not None:
+                if self.family_of.get(parent) in roots:
+                    nested.add(root)
+                    break
+                parent = self.parent.get(self.family_of.get(parent))
+        return roots - nested
+
+    def totals(self, root: Hashable, include_subtree: bool = False) -> Dict[str, Any]:
+        """Totals for one family: processes, cpu_percent, memory_percent, threads and handles."""
+        totals = self._subtree_totals(root) if include_subtree else self._own_totals(root)
+        result = dict(totals)
+        result['root_pid'] = root[0]
+        result['name'] = self.entries[root].get('name')
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'processes': len(self.family_of), 'families': len(self.members),
+                'dirty_families': len(self._dirty_own), 'recomputed': self.recomputed}
@@ -0,0 +1,215 @@
+import os
+import sys
+import time
+import psutil
+import threading
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from .process_snapshot import ProcessSnapshot
+
+WINDOWS = (1, 10, 60)
+# Cumulative byte counters sampled alongside CPU and memory, reported as rates
+IO_COUNTERS = ('disk_read', 'disk_write', 'net_sent', 'net_recv')
+
+
+class ResourceSampler:
+    """
+    Low-priority background thread that keeps resource figures warm.
+
+    System CPU and memory are sampled every ``interval`` seconds into numpy
+    ring buffers long enough for the largest window, so averages over the
+    last 1, 10 or 60 seconds are a slice and a mean. The process table is
+    refreshed every ``process_interval`` seconds, which also keeps psutil's
+    per-process CPU counters primed, so readers never have to block on a
+    measurement interval.
+
+    Every sample also records per-core CPU and the cumulative disk and network
+    byte counters, so throughput over any window is the counter difference
+    across it. The latest memory, swap, disk usage and load average are kept
+    as they are.
+
+    Each process refresh also yields a columnar ``process_snapshot`` that is
+    handed to every callable in ``listeners`` (for example the anomaly
+    detector) on the sampler thread.
+    """
+
+    def __init__(self, process_table=None, interval: float = 0.5, process_interval: float = 2.0,
+                 history_seconds: int = max(WINDOWS), nice: int = 10, disk_path: str = '/'):
+        self.process_table = process_table
+        self.disk_path = disk_path
+        self.interval = interval
+        self.process_interval = process_interval
+        self.nice = nice
+        self.capacity = int(history_seconds / interval) + 1
+        self.thread: Optional[threading.Thread] = None
+        self.running: bool = False
+        self.samples: int = 0
+        self.last_sample_cost: Optional[float] = None
+        self.process_snapshot: Optional[ProcessSnapshot] = None
+        self.listeners: List[Callable[[ProcessSnapshot], None]] = []
+        self._times = np.zeros(self.capacity)
+        self._cpu = np.zeros(self.capacity, dtype=np.float32)
+        self._memory = np.zeros(self.capacity, dtype=np.float32)
+        self._cores = np.zeros((self.capacity, psutil.cpu_count() or 1), dtype=np.float32)
+        self._io = np.zeros((self.capacity, len(IO_COUNTERS)))
+        self.latest: Dict[str, Any] = {}
+        self._last_process_refresh: float = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self.running and self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return False
+        # The first cpu_percent calls only set the baseline
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._stop.clear()
+        self.running = True
+        self.thread = threading.Thread(target=self._sample_loop, name="ResourceSampler")
+        self.thread.daemon = True
+        self.thread.start()
+        return True
+
+    def stop(self):
+        self.running = False
+        self._stop.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+
+    def _lower_priority(self):
+        # Only Linux treats a thread id as a setpriority target; elsewhere it would be read as a PID
+        if sys.platform.startswith("linux") and hasattr(threading, 'get_native_id'):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.nice)
+            except OSError:
+                pass
+
+    def _sample_loop(self):
+        self._lower_priority()
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"ERROR in resource sampler: {str(e)}")
+            self.last_sample_cost = time.perf_counter() - start
+            self._stop.wait(max(0.0, self.interval - self.last_sample_cost))
+
+    def sample(self):
+        """Take one system sample, and refresh the process table when it is due."""
+        now = self.sample_system()
+
+        if self.process_table is not None and now - self._last_process_refresh >= self.process_interval:
+            self._last_process_refresh = now
+            snapshot = ProcessSnapshot.from_entries(self.process_table.refresh())
+            self.process_snapshot = snapshot
+            for listener in self.listeners:
+                try:
+                    listener(snapshot)
+                except Exception as e:
+                    print(f"ERROR in resource sampler listener: {str(e)}")
+
+    def sample_system(self) -> float:
+        """Record one sample of the system-wide figures; every call here is non-blocking."""
+        now = time.time()
+        cpu = psutil.cpu_percent(interval=None)
+        cores = psutil.cpu_percent(interval=None, percpu=True)
+        memory = psutil.virtual_memory()
+        disk_io = psutil.disk_io_counters()
+        net_io = psutil.net_io_counters()
+        io = [disk_io.read_bytes if disk_io else 0, disk_io.write_bytes if disk_io else 0,
+              net_io.bytes_sent if net_io else 0, net_io.bytes_recv if net_io else 0]
+
+        latest = {'memory': memory, 'swap': psutil.swap_memory(), 'time': now}
+        try:
+            latest['disk'] = psutil.disk_usage(self.disk_path)
+        except OSError:
+            latest['disk'] = None
+        if hasattr(psutil, 'getloadavg'):
+            latest['load_average'] = psutil.getloadavg()
+
+        with self._lock:
+            slot = self.samples % self.capacity
+            self._times[slot] = now
+            self._cpu[slot] = cpu
+            self._memory[slot] = memory.percent
+            width = min(len(cores), self._cores.shape[1])
+            self._cores[slot, :width] = cores[:width]
+            self._io[slot] = io
+            self.latest = latest
+            self.samples += 1
+        return now
+
+    def _window(self, seconds: float) -> Dict[str, np.ndarray]:
+        """Samples from the last window seconds, oldest first."""
+        with self._lock:
+            count = min(self.samples, self.capacity)
+            window = {'times': self._times[:count].copy(), 'cpu': self._cpu[:count].copy(),
+                      'memory': self._memory[:count].copy(), 'cores': self._cores[:count].copy(),
+                      'io': self._io[:count].copy()}
+        if not count:
+            return window
+        times = window['times']
+        rows = np.flatnonzero(times >= times.max() - seconds + self.interval / 2)
+        rows = rows[np.argsort(times[rows])]
+        return {name: values[rows] for name, values in window.items()}
+
+    def get_cpu_percent(self, window: float = 1) -> Optional[float]:
+        """Average system CPU over the last window seconds, or None before the first sample."""
+        cpu = self._window(window)['cpu']
+        return round(float(cpu.mean()), 1) if cpu.size else None
+
+    def get_memory_percent(self, window: float = 1) -> Optional[float]:
+        memory = self._window(window)['memory']
+        return round(float(memory.mean()), 1) if memory.size else None
+
+    def get_per_core_percent(self, window: float = 1) -> Optional[List[float]]:
+        """Average CPU of each core over the last window seconds."""
+        cores = self._window(window)['cores']
+        return [round(float(c), 1) for c in cores.mean(axis=0)] if len(cores) else None
+
+    def get_io_rates(self, window: float = 1) -> Optional[Dict[str, float]]:
+        """
+        Disk and network throughput in bytes per second over the last window
+        seconds, or None until two samples exist.
+        """
+        # One extra interval so the first and last samples span the whole window
+        samples = self._window(window + self.interval)
+        times, io = samples['times'], samples['io']
+        if len(times) < 2 or times[-1] <= times[0]:
+            return None
+        # Counters can go backwards when a device or interface disappears
+        rates = np.maximum(io[-1] - io[0], 0) / (times[-1] - times[0])
+        return {f'{name}_bytes_per_sec': round(float(rate), 1) for name, rate in zip(IO_COUNTERS, rates)}
+
+    def get_latest(self) -> Dict[str, Any]:
+        """The most recent memory, swap, disk usage and load average readings."""
+        with self._lock:
+            return dict(self.latest)
+
+    def get_window_stats(self) -> Dict[str, Any]:
+        """Mean and peak CPU/memory for each of the standard windows."""
+        stats = {}
+        for window in WINDOWS:
+            samples = self._window(window)
+            cpu, memory = samples['cpu'], samples['memory']
+            if not cpu.size:
+                continue
+            stats[f'{window}s'] = {
+                'cpu_mean': round(float(cpu.mean()), 1),
+                'cpu_max': round(float(cpu.max()), 1),
+                'memory_mean': round(float(memory.mean()), 1),
+                'samples': int(cpu.size)
+            }
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'running': self.is_running,
+            'samples': self.samples,
+            'last_sample_cost_ms': round(self.last_sample_cost * 1000, 2) if self.last_sample_cost is not None else None
+        }
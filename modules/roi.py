@@ -0,0 +1,116 @@
+import cv2
+import time
+import threading
+from typing import List, Optional, Tuple
+import numpy as np
+
+Box = Tuple[int, int, int, int]
+
+
+class MotionRegionDetector:
+    """
+    Finds the part of the frame worth sending at full detail.
+
+    A running-average background is kept on a small grayscale thumbnail; pixels
+    that differ from it are grouped into motion boxes. Those boxes, together
+    with any text boxes from the OCR stage, are merged into one padded crop.
+    When the merged region covers most of the frame there is nothing to gain
+    from cropping and no region is returned.
+    """
+
+    def __init__(self, detect_width: int = 160, learning_rate: float = 0.05,
+                 diff_threshold: int = 25, min_area_ratio: float = 0.002,
+                 max_roi_ratio: float = 0.6, min_roi_ratio: float = 0.2,
+                 padding: float = 0.15, hold_seconds: float = 2.0):
+        self.detect_width = detect_width
+        self.learning_rate = learning_rate
+        self.diff_threshold = diff_threshold
+        self.min_area_ratio = min_area_ratio
+        self.max_roi_ratio = max_roi_ratio
+        self.min_roi_ratio = min_roi_ratio
+        self.padding = padding
+        self.hold_seconds = hold_seconds
+        self._background: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._motion_boxes: List[Box] = []
+        self._motion_time: float = 0
+
+    def update(self, frame: np.ndarray, frame_time: Optional[float] = None):
+        """Update the background model and motion boxes from one camera frame."""
+        height, width = frame.shape[:2]
+        scale = min(1.0, self.detect_width / float(width))
+        small = cv2.resize(frame, (max(1, int(width * scale)), max(1, int(height * scale))),
+                           interpolation=cv2.INTER_AREA)
+        gray = cv2.GaussianBlur(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY), (5, 5), 0)
+
+        if self._background is None or self._background.shape != gray.shape:
+            self._background = gray.astype(np.float32)
+            return
+
+        diff = cv2.absdiff(gray, cv2.convertScaleAbs(self._background))
+        cv2.accumulateWeighted(gray, self._background, self.learning_rate)
+        _, mask = cv2.threshold(diff, self.diff_threshold, 255, cv2.THRESH_BINARY)
+        mask = cv2.dilate(mask, None, iterations=2)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        min_area = self.min_area_ratio * gray.shape[0] * gray.shape[1]
+        inv = 1.0 / scale
+        boxes = []
+        for contour in contours:
+            if cv2.contourArea(contour) < min_area:
+                continue
+            x, y, w, h = cv2.boundingRect(contour)
+            boxes.append((int(x * inv), int(y * inv), int(w * inv), int(h * inv)))
+
+        if boxes:
+            with self._lock:
+                self._motion_boxes = boxes
+                self._motion_time = frame_time or time.time()
+
+    def get_motion_boxes(self) -> List[Box]:
+        """Return recent motion boxes; they are held briefly after movement stops."""
+        with self._lock:
+            if time.time() - self._motion_time > self.hold_seconds:
+                return []
+            return list(self._motion_boxes)
+
+    def get_roi(self, frame_shape, extra_boxes: Optional[List[Box]] = None) -> Optional[Box]:
+        """
+        Merge motion boxes and ``extra_boxes`` (e.g. text regions) into one crop.
+
+        Returns:
+            An (x, y, w, h) region in frame coordinates, or None when the whole
+            frame should be sent
+        """
+        boxes = self.get_motion_boxes() + list(extra_boxes or [])
+        if not boxes:
+            return None
+
+        height, width = frame_shape[:2]
+        x0 = min(b[0] for b in boxes)
+        y0 = min(b[1] for b in boxes)
+        x1 = max(b[0] + b[2] for b in boxes)
+        y1 = max(b[1] + b[3] for b in boxes)
+
+        # Pad, then grow to a minimum size so the crop keeps some context
+        pad_x, pad_y = int((x1 - x0) * self.padding), int((y1 - y0) * self.padding)
+        x0, y0, x1, y1 = x0 - pad_x, y0 - pad_y, x1 + pad_x, y1 + pad_y
+        min_w, min_h = int(width * self.min_roi_ratio), int(height * self.min_roi_ratio)
+        if x1 - x0 < min_w:
+            grow = (min_w - (x1 - x0)) // 2
+            x0, x1 = x0 - grow, x1 + grow
+        if y1 - y0 < min_h:
+            grow = (min_h - (y1 - y0)) // 2
+            y0, y1 = y0 - grow, y1 + grow
+
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(width, x1), min(height, y1)
+        if (x1 - x0) * (y1 - y0) > self.max_roi_ratio * width * height:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def reset(self):
+        self._background = None
+        with self._lock:
+            self._motion_boxes = []
+            self._motion_time = 0
@@ -0,0 +1,288 @@
+import cv2
+import json
+import time
+import queue
+import struct
+import hashlib
+import threading
+import types
+from typing import Optional, Dict, Any, Tuple
+import numpy as np
+
+# File layout: MAGIC, uint32 header length, JSON header, then records of
+# (float64 capture timestamp, uint32 JPEG length, JPEG bytes).
+MAGIC = b"LIAMREC1"
+RECORD_HEADER = struct.Struct('<dI')
+
+
+class SessionRecorder:
+    """
+    Records camera frames to a compact, timestamped session file.
+
+    Frames are JPEG-compressed on a writer thread so recording never slows the
+    capture loop; when the writer falls behind, frames are dropped and counted
+    rather than queued without bound.
+    """
+
+    def __init__(self, path: str, quality: int = 80, max_fps: Optional[float] = None,
+                 queue_size: int = 64):
+        self.path = path
+        self.quality = quality
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.frames_written: int = 0
+        self.frames_dropped: int = 0
+        self.bytes_written: int = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._last_time: float = 0
+        self._file = None
+        self._thread: Optional[threading.Thread] = None
+        self._running: bool = False
+
+    def start(self, metadata: Optional[Dict[str, Any]] = None):
+        header = dict(metadata or {})
+        header.update({'version': 1, 'created': time.time(), 'quality': self.quality})
+        header_bytes = json.dumps(header).encode('utf-8')
+
+        self._file = open(self.path, 'wb')
+        self._file.write(MAGIC)
+        self._file.write(struct.pack('<I', len(header_bytes)))
+        self._file.write(header_bytes)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._writer_loop, name="SessionRecorder")
+        self._thread.daemon = True
+        self._thread.start()
+        print(f"DEBUG: Recording camera session to {self.path}")
+
+    def write(self, frame: np.ndarray, timestamp: float):
+        """Queue a frame for recording (called from the capture thread)."""
+        if not self._running or timestamp - self._last_time < self.min_interval:
+            return
+        self._last_time = timestamp
+        try:
+            self._queue.put_nowait((frame.copy(), timestamp))
+        except queue.Full:
+            self.frames_dropped += 1
+
+    def _writer_loop(self):
+        while self._running or not self._queue.empty():
+            try:
+                frame, timestamp = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            success, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+            if not success:
+                self.frames_dropped += 1
+                continue
+            self._file.write(RECORD_HEADER.pack(timestamp, buffer.size))
+            self._file.write(buffer.tobytes())
+            self.frames_written += 1
+            self.bytes_written += RECORD_HEADER.size + buffer.size
+
+    def stop(self) -> Dict[str, Any]:
+        """Flush pending frames, close the file and return recording counters."""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        if self._file:
+            self._file.close()
+            self._file = None
+        print(f"DEBUG: Recorded {self.frames_written} frames ({self.bytes_written / 1024:.0f} KB), "
+              f"dropped {self.frames_dropped}")
+        return {'frames': self.frames_written, 'dropped': self.frames_dropped, 'bytes': self.bytes_written}
+
+
+def read_session(path: str):
+    """Yield (timestamp, frame) pairs from a session file in recorded order."""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a Liam session recording")
+        (header_len,) = struct.unpack('<I', f.read(4))
+        f.read(header_len)
+        while True:
+            record = f.read(RECORD_HEADER.size)
+            if len(record) < RECORD_HEADER.size:
+                return
+            timestamp, length = RECORD_HEADER.unpack(record)
+            data = np.frombuffer(f.read(length), dtype=np.uint8)
+            yield timestamp, cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+class ReplayCapture:
+    """
+    Drop-in stand-in for ``cv2.VideoCapture`` that plays a session file.
+
+    Frames are released at the recorded pace divided by ``speed``; a speed of
+    0 plays as fast as the consumer reads. Frame order is always the recorded
+    order, so runs over the same file see the same frames. ``clock()`` gives
+    the recorded capture time of the current frame, for scheduling work on
+    recorded rather than wall-clock time. A capture opened with ``paused``
+    holds its first frame back until ``resume()``.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, loop: bool = False, paused: bool = False):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.frames_read: int = 0
+        self._frames = read_session(path)
+        self._opened = True
+        self._first_timestamp: Optional[float] = None
+        self._start_time: float = 0
+        self._position_ms: float = 0
+        self._clock: float = 0
+        self._looped: float = 0
+        self._grabbed: Optional[np.ndarray] = None
+        self._resumed = threading.Event()
+        if not paused:
+            self._resumed.set()
+
+    def resume(self):
+        self._resumed.set()
+
+    def clock(self) -> float:
+        """Recorded capture time of the current frame; keeps increasing when looping."""
+        return self._clock
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def grab(self) -> bool:
+        if not self._opened:
+            return False
+        self._resumed.wait()
+        if not self._opened:
+            return False
+        try:
+            timestamp, frame = next(self._frames)
+        except StopIteration:
+            if not self.loop:
+                self._opened = False
+                return False
+            self._looped += self._position_ms / 1000.0
+            self._frames = read_session(self.path)
+            self._first_timestamp = None
+            return self.grab()
+
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+            self._start_time = time.time()
+
+        offset = timestamp - self._first_timestamp
+        if self.speed > 0:
+            delay = self._start_time + offset / self.speed - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+        self._position_ms = offset * 1000.0
+        self._clock = timestamp + self._looped
+        self._grabbed = frame
+        self.frames_read += 1
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._grabbed is None:
+            return False, None
+        return True, self._grabbed
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def get(self, prop_id) -> float:
+        if prop_id == cv2.CAP_PROP_POS_MSEC:
+            return self._position_ms
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.frames_read)
+        if self._grabbed is not None:
+            if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+                return float(self._grabbed.shape[1])
+            if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+                return float(self._grabbed.shape[0])
+        return 0.0
+
+    def set(self, prop_id, value) -> bool:
+        return False
+
+    def release(self):
+        self._opened = False
+        self._resumed.set()
+
+
+class CachedVisionClient:
+    """
+    Stand-in for the OpenAI client used when replaying sessions.
+
+    Answers are looked up by a hash of the request's image; misses go to
+    ``fallback_client`` when one is given (and are cached), otherwise a
+    deterministic stub answer is returned. ``delay`` simulates network time.
+    Call counts and uploaded bytes are kept for cost comparisons.
+    """
+
+    def __init__(self, fallback_client=None, cache_file: Optional[str] = None, delay: float = 0.0):
+        self.fallback_client = fallback_client
+        self.cache_file = cache_file
+        self.delay = delay
+        self.calls: int = 0
+        self.cache_hits: int = 0
+        self.bytes_uploaded: int = 0
+        self.cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if cache_file:
+            try:
+                with open(cache_file, 'r') as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError):
+                self.cache = {}
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+
+    @staticmethod
+    def _request_key(messages) -> Tuple[str, int]:
+        digest = hashlib.sha1()
+        size = 0
+        for message in messages:
+            content = message.get('content')
+            if not isinstance(content, list):
+                continue
+            for part in content:
+                if part.get('type') == 'image_url':
+                    url = part['image_url']['url']
+                    size += len(url)
+                    digest.update(url.encode('ascii', 'ignore'))
+                elif part.get('type') == 'text':
+                    digest.update(part['text'].encode('utf-8'))
+        return digest.hexdigest(), size
+
+    def _create(self, model=None, messages=None, **kwargs):
+        key, size = self._request_key(messages or [])
+        with self._lock:
+            self.calls += 1
+            self.bytes_uploaded += size
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+
+        if cached is None:
+            if self.fallback_client is not None:
+                response = self.fallback_client.chat.completions.create(model=model, messages=messages, **kwargs)
+                cached = response.choices[0].message.content
+            else:
+                cached = f"A recorded camera scene (frame {key[:8]})."
+            with self._lock:
+                self.cache[key] = cached
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        message = types.SimpleNamespace(content=cached)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    def save_cache(self):
+        if self.cache_file:
+            with open(self.cache_file, 'w') as f:
+                json.dump(self.cache, f)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'calls': self.calls, 'cache_hits': self.cache_hits, 'bytes_uploaded': self.bytes_uploaded}
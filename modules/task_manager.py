@@ -1,7 +1,33 @@
+import re
 import psutil
 import platform
 import subprocess
 from datetime import datetime
+from .process_table import ProcessTable
+from .resource_sampler import ResourceSampler
+from .process_snapshot import ProcessSnapshot
+from .process_anomaly import ProcessAnomalyDetector
+from .process_report import ProcessReport
+
+# Spoken application names mapped to (process name to search for, name to say)
+APP_ALIASES = {
+    "google chrome": ("chrome", "Google Chrome"),
+    "chrome": ("chrome", "Google Chrome"),
+    "browser": ("chrome", "Google Chrome"),
+    "visual studio code": ("code", "VS Code"),
+    "vs code": ("code", "VS Code"),
+    "vscode": ("code", "VS Code"),
+    "microsoft edge": ("msedge", "Microsoft Edge"),
+    "firefox": ("firefox", "Firefox"),
+    "spotify": ("spotify", "Spotify"),
+    "discord": ("discord", "Discord"),
+    "slack": ("slack", "Slack"),
+    "microsoft teams": ("teams", "Microsoft Teams"),
+    "zoom": ("zoom", "Zoom"),
+    "steam": ("steam", "Steam")
+}
+APP_USAGE_PATTERN = re.compile(r"how much (?:cpu |memory |ram |resources? )?(?:is|are|does) (.+?) (?:using|taking|use|take)\b")
+GENERIC_SUBJECTS = {"my system", "my computer", "my pc", "my laptop", "the system", "the computer", "everything", "it", "that"}
 
 class TaskManager:
     """
@@ -12,9 +38,17 @@ class TaskManager:
     def __init__(self):
         """Initialize the TaskManager with system‐specific settings."""
         self.system = platform.system()
-        self.process_cache = {}
+        self.boot_time = datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+        self.process_table = ProcessTable()
+        self.process_cache = []
+        self._snapshot = None
         self.last_update = None
         self.cache_ttl = 5  # Time in seconds before refreshing process cache
+        # Keeps CPU counters primed and the process table fresh in the background
+        self.sampler = ResourceSampler(self.process_table)
+        self.anomaly_detector = ProcessAnomalyDetector()
+        self.sampler.listeners.append(self.anomaly_detector.update)
+        self.sampler.start()
     
     def get_running_processes(self):
         """
@@ -26,26 +60,65 @@ class TaskManager:
             (current_time - self.last_update).total_seconds() < self.cache_ttl and 
             self.process_cache):
             return self.process_cache
-            
-        processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status']):
-            try:
-                proc_info = proc.info
-                proc_info['created'] = datetime.fromtimestamp(proc.create_time()).strftime("%Y-%m-%d %H:%M:%S")
-                try:
-                    proc_info['cmdline'] = ' '.join(proc.cmdline())
-                except (psutil.AccessDenied, psutil.ZombieProcess):
-                    proc_info['cmdline'] = "Access denied"
-                processes.append(proc_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-                
+        if self.sampler.is_running and not self.process_table.is_empty:
+            # The sampler already keeps the table current
+            processes = self.process_table.snapshot()
+        else:
+            # Only new processes cost a full lookup; known ones just refresh CPU/memory/status
+            processes = self.process_table.refresh()
+        
         self.process_cache = processes
         self.last_update = current_time
         
         return processes
     
+    def get_snapshot(self):
+        """
+        Return an immutable columnar ProcessSnapshot of the current process cache.
+        
+        The snapshot is rebuilt only when the cache itself was refreshed.
+        """
+        processes = self.get_running_processes()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] is not processes:
+            snapshot = (processes, ProcessSnapshot.from_entries(processes))
+            self._snapshot = snapshot
+        return snapshot[1]
+    
+    def get_top_processes(self, limit=10, sort_by='cpu_percent', **filters):
+        """
+        Return the top processes by sort_by without reordering the process cache.
+        
+        Filters (min_cpu, min_memory, name) are applied before ranking.
+        """
+        snapshot = self.get_snapshot()
+        rows = snapshot.rows(**filters) if filters else None
+        return snapshot.records(snapshot.top_k(limit, sort_by, rows))
+    
+    def get_anomalies(self, limit=5, min_score=3.0):
+        """
+        Return the processes whose CPU or memory stands out against both their
+        own history (or their executable's) and the rest of the host, with the
+        numbers behind each score.
+        """
+        return self.anomaly_detector.top_outliers(limit, min_score)
+    
+    def _describe_anomaly(self, outlier):
+        unit = "CPU" if outlier['metric'] == 'cpu' else "memory"
+        description = f"{outlier['name']} (PID: {outlier['pid']}) using {outlier['value']:.1f}% {unit}"
+        if outlier['own_mean'] is not None:
+            description += f", usually about {outlier['own_mean']:.1f}%"
+        elif outlier['exe_mean'] is not None:
+            description += f", other runs of it usually use about {outlier['exe_mean']:.1f}%"
+        else:
+            description += f", while a typical process uses {outlier['host_median']:.1f}%"
+        return description
+    
+    def get_refresh_stats(self):
+        """Return how long the last process table refresh took and how many processes came and went."""
+        return self.process_table.get_refresh_stats()
+    
     def get_process_details(self, pid):
         """
         Get detailed information about a specific process by PID.
@@ -74,6 +147,21 @@ class TaskManager:
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return None
     
+    def capture_report(self, limit=10, sort_by='cpu_percent'):
+        """
+        Capture the top processes and system usage once as a ProcessReport.
+        
+        Render it with report.render('spoken' | 'minimal' | 'normal' | 'detailed' | 'json').
+        """
+        processes = self.get_top_processes(limit, sort_by)
+        return ProcessReport(
+            processes,
+            total=len(self.process_cache),
+            sort_by=sort_by,
+            cpu_percent=self._system_cpu_percent(),
+            memory_percent=psutil.virtual_memory().percent
+        )
+    
     def describe_processes(self, limit=10, sort_by='cpu_percent', detail_level='normal', speak_summary=False):
         """
         Generate a human-readable description of running processes.
@@ -81,80 +169,90 @@ class TaskManager:
         Args:
             limit: Maximum number of processes to include in description
             sort_by: Field to sort by ('cpu_percent', 'memory_percent', or 'created')
-            detail_level: 'minimal', 'normal', or 'detailed'
+            detail_level: 'minimal', 'normal', 'detailed' or 'json'
             speak_summary: If True, return a short summary for speech instead of full details
             
         Returns:
             A string description of the current system processes
         """
-        processes = self.get_running_processes()
-        
-        if sort_by == 'cpu_percent':
-            processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
-        elif sort_by == 'memory_percent':
-            processes.sort(key=lambda p: p.get('memory_percent', 0), reverse=True)
-        elif sort_by == 'created':
-            processes.sort(key=lambda p: p.get('created', ''), reverse=True)
-        
-        processes = processes[:limit]
-        
-        if not processes:
-            return "No processes found or unable to access process information."
-        
-        if detail_level == 'minimal':
-            description = f"Top {len(processes)} running processes: "
-            process_list = [f"{p.get('name', 'Unknown')} (PID: {p.get('pid', 'N/A')})" for p in processes]
-            description += ", ".join(process_list)
-        
-        elif detail_level == 'detailed':
-            description = f"System running {len(self.process_cache)} total processes. Top {len(processes)} by {sort_by}:\n\n"
-            for p in processes:
-                description += f"- {p.get('name', 'Unknown')} (PID: {p.get('pid', 'N/A')})\n"
-                description += f"  CPU: {p.get('cpu_percent', 0):.1f}%, Memory: {p.get('memory_percent', 0):.1f}%\n"
-                description += f"  User: {p.get('username', 'Unknown')}, Status: {p.get('status', 'Unknown')}\n"
-                description += f"  Started: {p.get('created', 'Unknown')}\n"
-                if p.get('cmdline'):
-                    description += f"  Command: {p.get('cmdline')[:60]}{'...' if len(p.get('cmdline', '')) > 60 else ''}\n"
-                description += "\n"
-        
-        else:  # normal detail level
-            description = f"Currently running {len(self.process_cache)} processes. Top {len(processes)} by {sort_by}:\n"
-            for p in processes:
-                description += f"- {p.get('name', 'Unknown')} (PID: {p.get('pid', 'N/A')}): "
-                description += f"CPU {p.get('cpu_percent', 0):.1f}%, Mem {p.get('memory_percent', 0):.1f}%, "
-                description += f"Status: {p.get('status', 'Unknown')}\n"
-        
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        description += f"\nOverall system usage: CPU {cpu_percent}%, Memory {memory.percent}% used."
-        
-        if speak_summary:
-            return f"Currently running {len(self.process_cache)} processes. Top process by {sort_by}: {processes[0].get('name', 'Unknown')} using {processes[0].get('cpu_percent', 0):.1f}% CPU."
-        
-        return description
+        report = self.capture_report(limit, sort_by)
+        return report.render('spoken' if speak_summary else detail_level)
     
     def find_process_by_name(self, name):
         """
-        Find processes by name (case-insensitive, partial match).
-        Returns a list of matching processes.
+        Find processes by name (case-insensitive, partial match) or by exact
+        executable name, falling back to the most similar names for misheard
+        ones. Returns a list of matching processes.
         """
-        processes = self.get_running_processes()
-        name = name.lower()
-        
-        matching_processes = [p for p in processes if name in p.get('name', '').lower()]
+        # Keeps the table current; the lookup itself goes through the name index
+        self.get_running_processes()
+        matching_processes = self.process_table.find_by_name(name, fuzzy=True)
+        matching_processes.sort(key=lambda p: p['pid'])
         return matching_processes
     
-    def get_system_resource_usage(self):
+    def get_application_usage(self, name, include_subtree=False):
         """
-        Get overall system resource usage.
+        Total CPU, memory, threads and handles of an application across all its processes.
+        
+        Processes are grouped into families (a process and the helpers it
+        started with the same executable), so a browser or editor is counted
+        as a whole. With include_subtree, everything those families started is
+        included too. A name that matches nothing exactly falls back to the
+        most similar process names. Returns None when no process matches name.
+        """
+        if self.process_table.is_empty or not self.sampler.is_running:
+            self.process_table.refresh()
+        return self.process_table.get_family_usage(name, include_subtree, fuzzy=True)
+    
+    def _find_application(self, query):
+        """Return (process name, display name) for the application a query asks about, if any."""
+        for alias in sorted(APP_ALIASES, key=len, reverse=True):
+            if re.search(rf"\b{re.escape(alias)}\b", query):
+                return APP_ALIASES[alias]
+        match = APP_USAGE_PATTERN.search(query)
+        if match:
+            subject = match.group(1).strip()
+            if subject.startswith("the "):
+                subject = subject[4:]
+            if subject and subject not in GENERIC_SUBJECTS:
+                return subject, subject
+        return None
+    
+    def _system_cpu_percent(self, window=1):
+        """System CPU averaged over window seconds by the sampler, without blocking."""
+        cpu_percent = self.sampler.get_cpu_percent(window)
+        if cpu_percent is None:
+            # No sample yet; this measures since the sampler primed the counter
+            cpu_percent = psutil.cpu_percent(interval=None)
+        return cpu_percent
+    
+    def stop(self):
+        """Stop the background sampler."""
+        self.sampler.stop()
+    
+    def get_system_resource_usage(self, window=1):
+        """
+        Get overall system resource usage without blocking.
+        
+        CPU, per-core CPU and disk/network throughput are averaged over the
+        last window seconds of background samples. Memory, swap, disk space
+        and load average are the latest readings.
         Returns a dictionary with CPU, memory, disk, and network usage.
         """
-        cpu_percent = psutil.cpu_percent(interval=0.5)
-        virtual_memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        if not self.sampler.samples:
+            # Nothing sampled yet; one system sample is cheap and never waits
+            self.sampler.sample_system()
+        latest = self.sampler.get_latest()
+        virtual_memory = latest['memory']
+        swap = latest['swap']
+        disk = latest['disk']
+        rates = self.sampler.get_io_rates(window) or {}
         
         info = {
-            'cpu_percent': cpu_percent,
+            'window': window,
+            'cpu_percent': self._system_cpu_percent(window),
+            'per_core_cpu': self.sampler.get_per_core_percent(window),
+            'load_average': latest.get('load_average'),
             'memory': {
                 'total': virtual_memory.total,
                 'available': virtual_memory.available,
@@ -162,13 +260,26 @@ class TaskManager:
                 'used': virtual_memory.used,
                 'free': virtual_memory.free
             },
+            'swap': {
+                'total': swap.total,
+                'used': swap.used,
+                'percent': swap.percent
+            },
             'disk': {
-                'total': disk.total,
-                'used': disk.used,
-                'free': disk.free,
-                'percent': disk.percent
+                'total': disk.total if disk else 0,
+                'used': disk.used if disk else 0,
+                'free': disk.free if disk else 0,
+                'percent': disk.percent if disk else 0
+            },
+            'disk_io': {
+                'read_bytes_per_sec': rates.get('disk_read_bytes_per_sec'),
+                'write_bytes_per_sec': rates.get('disk_write_bytes_per_sec')
+            },
+            'network': {
+                'sent_bytes_per_sec': rates.get('net_sent_bytes_per_sec'),
+                'recv_bytes_per_sec': rates.get('net_recv_bytes_per_sec')
             },
-            'boot_time': datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+            'boot_time': self.boot_time
         }
         
         return info
@@ -198,51 +309,36 @@ class TaskManager:
         """
         query = query.lower()
         
-        # Check for specific process queries
-        if any(app in query for app in ["chrome", "google chrome", "browser"]):
-            chrome_processes = self.find_process_by_name("chrome")
-            if chrome_processes:
-                total_chrome_cpu = sum(p.get('cpu_percent', 0) for p in chrome_processes)
-                total_chrome_memory = sum(p.get('memory_percent', 0) for p in chrome_processes)
-                
-                return (f"Yes, Google Chrome is running with {len(chrome_processes)} processes. "
-                        f"Chrome is using {total_chrome_cpu:.1f}% CPU and {total_chrome_memory:.1f}% memory in total.")
-            else:
-                return "No, Google Chrome doesn't appear to be running at the moment."
-        
         # Check for "suspicious" or unusual processes
         if any(term in query for term in ["suspicious", "unusual", "strange", "weird", "malware", "virus"]):
-            processes = self.get_running_processes()
-            processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
+            outliers = self.get_anomalies(3)
             
-            high_cpu_procs = [p for p in processes if p.get('cpu_percent', 0) > 15]
-            
-            if high_cpu_procs:
-                response = "I noticed these processes with unusually high CPU usage:\n"
-                for p in high_cpu_procs[:3]:  # Show top 3 CPU users
-                    response += f"- {p.get('name', 'Unknown')} using {p.get('cpu_percent', 0):.1f}% CPU\n"
-                response += "\nHigh CPU usage isn't necessarily suspicious but might be worth checking."
+            if outliers:
+                response = "I noticed these processes behaving unusually:\n"
+                for outlier in outliers:
+                    response += f"- {self._describe_anomaly(outlier)}\n"
+                response += "\nUnusual resource usage isn't necessarily suspicious but might be worth checking."
                 return response
+            elif not self.anomaly_detector.is_warm:
+                return "I'm still learning what normal looks like on this computer. Ask me again in a few seconds."
             else:
                 return "I didn't detect any processes with unusually high resource usage that might be suspicious."
         
         # Check for resource hog queries
         if any(term in query for term in ["using most", "highest", "top process", "resource hog", "cpu hog", "memory hog"]):
-            processes = self.get_running_processes()
+            if not self.get_running_processes():
+                return "I couldn't read the process list right now."
             
             if "cpu" in query or "processor" in query:
-                processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
-                top_proc = processes[0]
+                top_proc = self.get_top_processes(1, 'cpu_percent')[0]
                 return f"The process using the most CPU is {top_proc.get('name', 'Unknown')} (PID: {top_proc.get('pid', 'N/A')}) at {top_proc.get('cpu_percent', 0):.1f}% CPU usage."
             
             elif "memory" in query or "ram" in query:
-                processes.sort(key=lambda p: p.get('memory_percent', 0), reverse=True)
-                top_proc = processes[0]
+                top_proc = self.get_top_processes(1, 'memory_percent')[0]
                 return f"The process using the most memory is {top_proc.get('name', 'Unknown')} (PID: {top_proc.get('pid', 'N/A')}) at {top_proc.get('memory_percent', 0):.1f}% memory usage."
             
             else:
-                processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
-                top_proc = processes[0]
+                top_proc = self.get_top_processes(1, 'cpu_percent')[0]
                 return f"The top resource-using process is {top_proc.get('name', 'Unknown')} at {top_proc.get('cpu_percent', 0):.1f}% CPU and {top_proc.get('memory_percent', 0):.1f}% memory."
         
         # Check for "should I end/kill/terminate" queries
@@ -276,6 +372,22 @@ class TaskManager:
             
             return "I need to know which process you're asking about terminating."
         
+        # Check for a specific application, counted across all of its processes.
+        # This comes after the kill advice so "should I kill spotify" is not answered with usage totals
+        application = self._find_application(query)
+        if application:
+            process_name, display_name = application
+            usage = self.get_application_usage(process_name)
+            if usage:
+                response = (f"Yes, {display_name} is running with {usage['processes']} processes. "
+                            f"{display_name} is using {usage['cpu_percent']:.1f}% CPU and "
+                            f"{usage['memory_percent']:.1f}% memory in total, across {usage['threads']} threads")
+                if usage['handles'] is not None:
+                    response += f" and {usage['handles']} handles"
+                return response + "."
+            else:
+                return f"No, {display_name} doesn't appear to be running at the moment."
+        
         # General system health query
         if any(term in query for term in ["system health", "is my computer ok", "computer running well", "pc health", "laptop health"]):
             resources = self.get_system_resource_usage()
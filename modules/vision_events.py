@@ -0,0 +1,220 @@
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+EVENT_TYPES = ("description", "ocr_text", "faces", "scene_change")
+
+
+class Subscription:
+    """
+    One subscriber's bounded event queue.
+
+    When the queue is full the oldest event is discarded, so a slow consumer
+    only ever misses history and never holds up the camera threads. Events
+    can be pulled with ``get()``; ``close()`` unsubscribes.
+    """
+
+    def __init__(self, bus: "VisionEventBus", events: Optional[Iterable[str]] = None, max_queue: int = 16):
+        self.events = set(events) if events else set(EVENT_TYPES)
+        self.dropped: int = 0
+        self.delivered: int = 0
+        self.closed: bool = False
+        self._bus = bus
+        self._queue = deque(maxlen=max(1, max_queue))
+        self._cond = threading.Condition()
+
+    def _offer(self, event: Dict[str, Any]):
+        with self._cond:
+            if self.closed:
+                return
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(event)
+            self._cond.notify()
+        self._wake()
+
+    def _wake(self):
+        pass
+
+    def _pop(self) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            if not self._queue:
+                return None
+            self.delivered += 1
+            return self._queue.popleft()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait up to timeout seconds for the next event; None on timeout or when closed."""
+        with self._cond:
+            if not self._queue and not self.closed:
+                self._cond.wait(timeout)
+            if not self._queue:
+                return None
+            self.delivered += 1
+            return self._queue.popleft()
+
+    def close(self):
+        self._bus.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+        self._wake()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {'queued': len(self._queue), 'delivered': self.delivered, 'dropped': self.dropped}
+
+
+class CallbackSubscription(Subscription):
+    """Delivers events to a callback on the subscription's own thread."""
+
+    def __init__(self, bus, callback: Callable[[Dict[str, Any]], None], events=None, max_queue: int = 16):
+        super().__init__(bus, events, max_queue)
+        self.callback = callback
+        self.thread = threading.Thread(target=self._deliver_loop, name="VisionEventCallback")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _deliver_loop(self):
+        while not self.closed:
+            event = self.get(timeout=1.0)
+            if event is None:
+                continue
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"ERROR in vision event callback: {str(e)}")
+
+
+class AsyncSubscription(Subscription):
+    """
+    Async iterator over events for use inside an asyncio event loop.
+
+        async with camera_manager.events.subscribe_async(["description"]) as events:
+            async for event in events:
+                ...
+    """
+
+    def __init__(self, bus, loop: asyncio.AbstractEventLoop, events=None, max_queue: int = 16):
+        super().__init__(bus, events, max_queue)
+        self._loop = loop
+        self._ready = asyncio.Event()
+
+    def _wake(self):
+        # Publishers run on camera threads; hand the wake-up to the loop thread
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        while True:
+            event = self._pop()
+            if event is not None:
+                return event
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            # Re-check so an event published before clear() is not missed
+            if self._queue or self.closed:
+                continue
+            await self._ready.wait()
+
+
+class VisionEventBus:
+    """
+    Thread-safe publish/subscribe for camera analysis results.
+
+    Events are dictionaries with 'type' (one of EVENT_TYPES), 'timestamp',
+    'frame_time' and 'data'. Publishing only appends to each matching
+    subscriber's bounded queue, so it is cheap to call from the capture,
+    OCR and vision worker threads.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self.published: Dict[str, int] = {event_type: 0 for event_type in EVENT_TYPES}
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None], events: Optional[Iterable[str]] = None,
+                  max_queue: int = 16) -> CallbackSubscription:
+        """Call callback(event) for each matching event, from a dedicated thread."""
+        return self._add(CallbackSubscription(self, callback, self._check(events), max_queue))
+
+    def subscribe_queue(self, events: Optional[Iterable[str]] = None, max_queue: int = 16) -> Subscription:
+        """Return a subscription to poll with get()."""
+        return self._add(Subscription(self, self._check(events), max_queue))
+
+    def subscribe_async(self, events: Optional[Iterable[str]] = None, max_queue: int = 16,
+                        loop: Optional[asyncio.AbstractEventLoop] = None) -> AsyncSubscription:
+        """Return an async iterator of events; call from the event loop that will consume it."""
+        loop = loop or asyncio.get_running_loop()
+        return self._add(AsyncSubscription(self, loop, self._check(events), max_queue))
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+        subscription._close()
+
+    def publish(self, event_type: str, data: Any, frame_time: Optional[float] = None):
+        if event_type not in self.published:
+            raise ValueError(f"Unknown vision event type: {event_type}")
+
+        with self._lock:
+            subscribers = [s for s in self._subscribers if event_type in s.events]
+            self.published[event_type] += 1
+        if not subscribers:
+            return
+
+        event = {'type': event_type, 'timestamp': time.time(), 'frame_time': frame_time, 'data': data}
+        for subscription in subscribers:
+            subscription._offer(event)
+
+    def close(self):
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscription in subscribers:
+            subscription._close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'published': dict(self.published),
+                'dropped': sum(s.dropped for s in self._subscribers)
+            }
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    @staticmethod
+    def _check(events: Optional[Iterable[str]]) -> Optional[List[str]]:
+        if events is None:
+            return None
+        events = [events] if isinstance(events, str) else list(events)
+        unknown = [e for e in events if e not in EVENT_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown vision event type(s): {', '.join(unknown)}")
+        return events